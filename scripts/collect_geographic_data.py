@@ -10,14 +10,18 @@ Downloads:
 Usage:
     python scripts/collect_geographic_data.py
 """
-import json
 import logging
 import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
-import pandas as pd
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,6 +34,32 @@ PROCESSED_DIR = Path("data/processed")
 VMRC_ANNUAL_URL = "https://www.inegi.org.mx/contenidos/programas/vehiculosmotor/datosabiertos/vmrc_anual_csv.zip"
 VMRC_MONTHLY_URL = "https://www.inegi.org.mx/contenidos/programas/vehiculosmotor/datosabiertos/vmrc_mensual_csv.zip"
 
+# Registration count columns in the VMRC annual CSV (oficial/público/particular
+# per vehicle class); only these and ID_ENTIDAD are needed downstream
+VMRC_COUNT_COLUMNS = [
+    'AUTO_OFICIAL', 'AUTO_PUBLICO', 'AUTO_PARTICULAR',
+    'CYC_CARGA_OFICIAL', 'CYC_CARGA_PUBLICO', 'CYC_CARGA_PARTICULAR',
+    'MOTO_OFICIAL', 'MOTO_DE_ALQUILER', 'MOTO_PARTICULAR',
+]
+
+# Buffer size used when streaming downloads and ZIP members to disk
+CHUNK_SIZE = 1 << 16
+
+# ETag/Last-Modified validators of previously downloaded archives
+DOWNLOAD_CACHE = RAW_DIR / ".cache.json"
+
+# Shared HTTP session so both downloads reuse pooled connections to INEGI
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "application/zip,application/octet-stream,*/*",
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
 # Target cities and their states
 CITY_STATE_MAP = {
     "Ciudad de México": "Ciudad de México",
@@ -73,54 +103,149 @@ NATIONAL_EV_SALES = {
 }
 
 
-def download_vmrc_data():
-    """Download VMRC annual and monthly data from INEGI"""
-    RAW_DIR.mkdir(parents=True, exist_ok=True)
+def _zip_ok(path: Path) -> bool:
+    """Check that a local ZIP archive exists and is intact"""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return zf.testzip() is None
+    except (OSError, zipfile.BadZipFile):
+        return False
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Accept": "application/zip,application/octet-stream,*/*",
+
+def _validators(resp) -> dict:
+    """Extract the cache validators from a response"""
+    return {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
     }
 
-    # Download annual data
-    logger.info("Downloading VMRC annual data...")
-    annual_zip = RAW_DIR / "vmrc_anual_csv.zip"
-    try:
-        resp = requests.get(VMRC_ANNUAL_URL, headers=headers, timeout=120)
+
+def _download(url: str, dest: Path, cached: dict | None = None) -> dict:
+    """Stream a remote file to disk without buffering it in memory
+
+    Skips the download when the local copy is intact and the server reports
+    it unchanged since the cached validators were recorded.
+
+    Returns:
+        Cache entry with the validators for the file now at dest
+    """
+    headers = {}
+    if cached and _zip_ok(dest):
+        head = SESSION.head(url, timeout=30, allow_redirects=True)
+        if head.ok and any(cached.get(k) and cached.get(k) == v for k, v in _validators(head).items()):
+            logger.info(f"{dest.name} unchanged, using local copy")
+            return cached
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with SESSION.get(url, headers=headers, stream=True, timeout=120) as resp:
+        if resp.status_code == 304:
+            logger.info(f"{dest.name} not modified, using local copy")
+            return cached
         resp.raise_for_status()
-        with open(annual_zip, 'wb') as f:
-            f.write(resp.content)
-        logger.info(f"Downloaded {annual_zip}")
+        resp.raw.decode_content = True
+        with open(dest, 'wb') as f:
+            shutil.copyfileobj(resp.raw, f, CHUNK_SIZE)
+        return {**_validators(resp), "path": str(dest)}
+
+
+def _annual_members(names: list[str]) -> set[str]:
+    """Pick the annual archive members process_state_registrations() reads:
+    the latest year's registrations and the state catalog"""
+    data = [n for n in names if Path(n).name.startswith("vmrc_anual_tr_cifra_") and n.endswith(".csv")]
+    wanted = {n for n in names if n.endswith("catalogos/tc_entidad.csv")}
+    if data:
+        wanted.add(max(data, key=lambda n: Path(n).name))
+    return wanted
+
+
+def _extract(zip_path: Path, dest_dir: Path, select=None):
+    """Extract a ZIP archive member by member, streaming each one to disk
+
+    Args:
+        zip_path: Archive to extract
+        dest_dir: Directory to extract into
+        select: Optional callable mapping the member names to the subset to extract
+    """
+    root = dest_dir.resolve()
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        wanted = select(zf.namelist()) if select else None
+        for info in zf.infolist():
+            if info.is_dir() or (wanted is not None and info.filename not in wanted):
+                continue
+            target = (dest_dir / info.filename).resolve()
+            if not target.is_relative_to(root):
+                logger.warning(f"Skipping unsafe archive member: {info.filename}")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+
+def _fetch_archive(label: str, url: str, zip_path: Path, extract_dir: Path, select=None, cached: dict | None = None):
+    """Download a VMRC archive and extract it, returning its cache entry"""
+    logger.info(f"Downloading VMRC {label} data...")
+    try:
+        entry = _download(url, zip_path, cached)
+        logger.info(f"Downloaded {zip_path}")
 
         # Extract
-        with zipfile.ZipFile(annual_zip, 'r') as zf:
-            zf.extractall(RAW_DIR)
-        logger.info("Extracted annual data")
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        _extract(zip_path, extract_dir, select)
+        logger.info(f"Extracted {label} data")
+        return entry
     except Exception as e:
-        logger.error(f"Failed to download annual data: {e}")
+        logger.error(f"Failed to download {label} data: {e}")
+        return None
+
+
+def download_vmrc_data():
+    """Download VMRC annual and monthly data from INEGI"""
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+
+    archives = [
+        ("annual", VMRC_ANNUAL_URL, RAW_DIR / "vmrc_anual_csv.zip", RAW_DIR, _annual_members),
+        ("monthly", VMRC_MONTHLY_URL, RAW_DIR / "vmrc_mensual_csv.zip", RAW_DIR / "mensual", None),
+    ]
 
-    # Download monthly data
-    logger.info("Downloading VMRC monthly data...")
-    monthly_zip = RAW_DIR / "vmrc_mensual_csv.zip"
     try:
-        resp = requests.get(VMRC_MONTHLY_URL, headers=headers, timeout=120)
-        resp.raise_for_status()
-        with open(monthly_zip, 'wb') as f:
-            f.write(resp.content)
-        logger.info(f"Downloaded {monthly_zip}")
+        cache = orjson.loads(DOWNLOAD_CACHE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        cache = {}
 
-        # Extract
-        monthly_dir = RAW_DIR / "mensual"
-        monthly_dir.mkdir(exist_ok=True)
-        with zipfile.ZipFile(monthly_zip, 'r') as zf:
-            zf.extractall(monthly_dir)
-        logger.info("Extracted monthly data")
-    except Exception as e:
-        logger.error(f"Failed to download monthly data: {e}")
+    # Both downloads are network-bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(archives)) as ex:
+        futures = {
+            archive[1]: ex.submit(_fetch_archive, *archive, cached=cache.get(archive[1]))
+            for archive in archives
+        }
+        for url, future in futures.items():
+            entry = future.result()
+            if entry:
+                cache[url] = entry
+            else:
+                cache.pop(url, None)
+
+    DOWNLOAD_CACHE.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+
+
+def _with_state_ids(df):
+    """Coerce ID_ENTIDAD to uint8 (INEGI state IDs are 1-32), dropping bad rows"""
+    import pandas as pd
+
+    df['ID_ENTIDAD'] = pd.to_numeric(df['ID_ENTIDAD'], errors='coerce')
+    return df.dropna(subset=['ID_ENTIDAD']).astype({'ID_ENTIDAD': 'uint8'})
 
 
 def process_state_registrations():
     """Process VMRC data to get vehicle registrations by state"""
+    # pandas/numpy are only needed here; importing them lazily keeps the
+    # download step and standalone EV estimates fast to start
+    import numpy as np
+    import pandas as pd
+
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
     # Find latest annual data file
@@ -145,95 +270,109 @@ def process_state_registrations():
         logger.warning("State catalog not found")
         return None
 
-    states = pd.read_csv(states_file)
-    states['ID_ENTIDAD'] = states['ID_ENTIDAD'].astype(str).str.strip()
-
-    # Load annual data
-    df = pd.read_csv(latest_file)
-    df['ID_ENTIDAD'] = df['ID_ENTIDAD'].astype(str).str.strip()
-
-    # Calculate totals
-    df['TOTAL_AUTOS'] = df['AUTO_OFICIAL'] + df['AUTO_PUBLICO'] + df['AUTO_PARTICULAR']
-    df['TOTAL_TRUCKS'] = df['CYC_CARGA_OFICIAL'] + df['CYC_CARGA_PUBLICO'] + df['CYC_CARGA_PARTICULAR']
-    df['TOTAL_MOTOS'] = df['MOTO_OFICIAL'] + df['MOTO_DE_ALQUILER'] + df['MOTO_PARTICULAR']
-    df['TOTAL_VEHICLES'] = df['TOTAL_AUTOS'] + df['TOTAL_TRUCKS'] + df['TOTAL_MOTOS']
-
-    # Aggregate by state
-    state_totals = df.groupby('ID_ENTIDAD').agg({
-        'TOTAL_AUTOS': 'sum',
-        'TOTAL_TRUCKS': 'sum',
-        'TOTAL_MOTOS': 'sum',
-        'TOTAL_VEHICLES': 'sum'
-    }).reset_index()
+    # Load the state catalog and the annual data (only the columns we
+    # aggregate) side by side; the C parser releases the GIL while reading
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        states_future = ex.submit(pd.read_csv, states_file)
+        df_future = ex.submit(pd.read_csv, latest_file, usecols=['ID_ENTIDAD', *VMRC_COUNT_COLUMNS])
+        states = _with_state_ids(states_future.result())
+        df = _with_state_ids(df_future.result())
+
+    # Calculate totals: the count columns come in blocks of three per vehicle
+    # class, so sum each block in a single pass over one int64 array
+    counts = df[VMRC_COUNT_COLUMNS].fillna(0).to_numpy(dtype=np.int64)
+    totals = counts.reshape(len(counts), 3, 3).sum(axis=2)
+    totals = np.column_stack([totals, totals.sum(axis=1)])
+
+    # Aggregate by state: state IDs are small dense integers, so bincount each
+    # total by ID instead of running a hash groupby
+    ids = df['ID_ENTIDAD'].to_numpy()
+    state_ids = np.flatnonzero(np.bincount(ids))
+    sums = np.column_stack([
+        np.bincount(ids, weights=totals[:, k])[state_ids]
+        for k in range(totals.shape[1])
+    ])
+    state_totals = pd.DataFrame(
+        sums.astype(np.int64),
+        columns=['TOTAL_AUTOS', 'TOTAL_TRUCKS', 'TOTAL_MOTOS', 'TOTAL_VEHICLES'],
+    )
+    state_totals.insert(0, 'ID_ENTIDAD', state_ids.astype(np.uint8))
 
     state_totals = state_totals.merge(states, on='ID_ENTIDAD', how='left')
 
     # Build city-level data
+    by_name = {row.NOM_ENTIDAD: row for row in state_totals.itertuples(index=False)}
     city_data = []
     for city, state in CITY_STATE_MAP.items():
-        state_row = state_totals[state_totals['NOM_ENTIDAD'] == state]
-        if not state_row.empty:
+        r = by_name.get(state)
+        if r is not None:
             city_data.append({
                 "city": city,
                 "state": state,
-                "total_autos": int(state_row['TOTAL_AUTOS'].values[0]),
-                "total_trucks": int(state_row['TOTAL_TRUCKS'].values[0]),
-                "total_motos": int(state_row['TOTAL_MOTOS'].values[0]),
-                "total_vehicles": int(state_row['TOTAL_VEHICLES'].values[0])
+                "total_autos": int(r.TOTAL_AUTOS),
+                "total_trucks": int(r.TOTAL_TRUCKS),
+                "total_motos": int(r.TOTAL_MOTOS),
+                "total_vehicles": int(r.TOTAL_VEHICLES)
             })
 
-    # Sort by total vehicles
-    city_data.sort(key=lambda x: x['total_vehicles'], reverse=True)
-
     # Calculate market share
-    total = sum(c['total_vehicles'] for c in city_data)
+    total = sum(map(itemgetter('total_vehicles'), city_data))
     for c in city_data:
         c['market_share_pct'] = round(c['total_vehicles'] / total * 100, 1)
 
+    # Sort by total vehicles
+    city_data.sort(key=itemgetter('total_vehicles'), reverse=True)
+
     # Save
     output_file = PROCESSED_DIR / f"city_vehicle_registrations_{year}.json"
-    with open(output_file, 'w') as f:
-        json.dump(city_data, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(orjson.dumps(city_data, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Saved registrations to {output_file}")
     return city_data
 
 
-def generate_ev_estimates():
-    """Generate EV/Hybrid sales estimates by state"""
+def generate_ev_estimates(reg_data: list | None = None):
+    """Generate EV/Hybrid sales estimates by state
+
+    Args:
+        reg_data: City registrations from process_state_registrations(); when
+            omitted, the newest saved registrations file is loaded instead
+    """
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Load registration data for reference
-    reg_file = list(PROCESSED_DIR.glob("city_vehicle_registrations_*.json"))
-    reg_data = []
-    if reg_file:
-        with open(reg_file[-1]) as f:
-            reg_data = json.load(f)
+    # Load registration data for reference (newest year) when run standalone
+    if reg_data is None:
+        reg_files = sorted(PROCESSED_DIR.glob("city_vehicle_registrations_*.json"))
+        reg_data = orjson.loads(reg_files[-1].read_bytes()) if reg_files else []
+
+    # EV sales depend only on the state, so compute them once per state
+    state_ev = {
+        state: {year: int(total * STATE_EV_SHARE.get(state, 0.01)) for year, total in NATIONAL_EV_SALES.items()}
+        for state in set(CITY_STATE_MAP.values())
+    }
 
     # Build state-level EV estimates
+    reg_by_city = {r["city"]: r for r in reg_data}
     state_ev_data = []
     for city, state in CITY_STATE_MAP.items():
         share = STATE_EV_SHARE.get(state, 0.01)
-
-        ev_sales_by_year = {}
-        for year, total in NATIONAL_EV_SALES.items():
-            ev_sales_by_year[year] = int(total * share)
+        ev_sales_by_year = state_ev[state]
 
         # Get registration data
-        reg_info = next((r for r in reg_data if r.get("city") == city), None)
+        reg_info = reg_by_city.get(city)
 
         state_ev_data.append({
             "city": city,
             "state": state,
             "ev_hybrid_share_pct": round(share * 100, 1),
-            "estimated_ev_sales_2023": ev_sales_by_year.get("2023", 0),
-            "estimated_ev_sales_2024": ev_sales_by_year.get("2024", 0),
+            "estimated_ev_sales_2023": ev_sales_by_year["2023"],
+            "estimated_ev_sales_2024": ev_sales_by_year["2024"],
             "total_vehicle_registrations": reg_info["total_vehicles"] if reg_info else 0,
             "annual_ev_sales": ev_sales_by_year
         })
 
     # Sort by EV sales
-    state_ev_data.sort(key=lambda x: x["estimated_ev_sales_2023"], reverse=True)
+    state_ev_data.sort(key=itemgetter("estimated_ev_sales_2023"), reverse=True)
 
     # Save
     output = {
@@ -246,8 +385,7 @@ def generate_ev_estimates():
     }
 
     output_file = PROCESSED_DIR / "ev_sales_by_state_estimated.json"
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Saved EV estimates to {output_file}")
     return state_ev_data
@@ -266,7 +404,7 @@ def main():
         logger.info(f"Processed registrations for {len(reg_data)} cities")
 
     # Generate EV estimates
-    ev_data = generate_ev_estimates()
+    ev_data = generate_ev_estimates(reg_data)
     if ev_data:
         logger.info(f"Generated EV estimates for {len(ev_data)} cities")
 
@@ -2,16 +2,48 @@
 """
 Scrape INEGI EV/Hybrid sales by state from interactive tabulado
 """
-import json
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+
+import orjson
 
 OUTPUT_FILE = Path("data/processed/inegi_ev_sales_by_state.json")
 
+# Checks every "Todo" (select all) option on the tabulado in one round-trip
+# and reports how many checkboxes end up checked
+SELECT_ALL_JS = """
+    () => {
+        const check = cb => {
+            if (cb && !cb.checked) {
+                cb.click();
+            }
+        };
+
+        // "Todo" labels and their associated checkboxes
+        [...document.querySelectorAll('label')]
+            .filter(label => label.textContent.trim() === 'Todo')
+            .forEach(label => check(
+                label.control ||
+                label.parentElement.querySelector('input[type="checkbox"]') ||
+                label.previousElementSibling
+            ));
+
+        // Remaining checkboxes whose label mentions "Todo"
+        document.querySelectorAll('input[type="checkbox"]').forEach(cb => {
+            const label = cb.nextElementSibling || cb.parentElement;
+            if (label && label.innerText && label.innerText.includes('Todo')) {
+                check(cb);
+            }
+        });
+
+        return { checked: document.querySelectorAll('input[type="checkbox"]:checked').length };
+    }
+"""
+
 
 def scrape_ev_sales_by_state():
     """Scrape EV/Hybrid sales by state from INEGI interactive tabulado"""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -20,90 +52,23 @@ def scrape_ev_sales_by_state():
         print("Navigating to INEGI tabulado...")
         page.goto("https://www.inegi.org.mx/app/tabulados/interactivos/?px=RAIAVL_11&bd=RAIAVL")
         page.wait_for_load_state("networkidle")
-        time.sleep(5)
+        try:
+            page.wait_for_selector('input[type="checkbox"]', state="attached")
+        except PlaywrightTimeoutError:
+            print("No checkboxes found on the page")
 
         # Find and click all "Todo" checkboxes by their label text
         print("Selecting all options...")
-
-        # Get all checkbox containers
-        # The structure seems to be: checkbox followed by label with "Todo" text
-        page.evaluate("""
-            () => {
-                // Find all labels containing "Todo" and click their associated checkboxes
-                const labels = document.querySelectorAll('label');
-                labels.forEach(label => {
-                    if (label.innerText.trim() === 'Todo') {
-                        const checkbox = label.previousElementSibling ||
-                                         label.querySelector('input[type="checkbox"]') ||
-                                         label.parentElement.querySelector('input[type="checkbox"]');
-                        if (checkbox && !checkbox.checked) {
-                            checkbox.click();
-                        }
-                    }
-                });
-            }
-        """)
-        time.sleep(2)
-
-        # Alternative: Click by finding checkboxes near "Todo" text
-        page.evaluate("""
-            () => {
-                // Find all elements containing "Todo" text
-                const walker = document.createTreeWalker(
-                    document.body,
-                    NodeFilter.SHOW_TEXT,
-                    null,
-                    false
-                );
-                const todoElements = [];
-                while (walker.nextNode()) {
-                    if (walker.currentNode.textContent.trim() === 'Todo') {
-                        todoElements.push(walker.currentNode.parentElement);
-                    }
-                }
-
-                todoElements.forEach(el => {
-                    // Try to find checkbox near this element
-                    const parent = el.parentElement;
-                    const checkbox = parent.querySelector('input[type="checkbox"]');
-                    if (checkbox && !checkbox.checked) {
-                        checkbox.click();
-                    }
-                });
-            }
-        """)
-        time.sleep(2)
+        selection = page.evaluate(SELECT_ALL_JS)
+        print(f"Checked {selection['checked']} options")
+        # Checking options reloads the table, so let it settle before capturing
+        if selection['checked']:
+            page.wait_for_load_state("networkidle")
 
         # Take screenshot
         page.screenshot(path="data/outputs/inegi_ev_screenshot_2.png")
         print("Screenshot saved to data/outputs/inegi_ev_screenshot_2.png")
 
-        # Now scroll down to find "Unidades vehiculares" and select its Todo
-        page.evaluate("""
-            () => {
-                window.scrollBy(0, 300);
-            }
-        """)
-        time.sleep(1)
-
-        # Click any remaining Todo checkboxes
-        page.evaluate("""
-            () => {
-                const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-                checkboxes.forEach((cb, idx) => {
-                    // Get the label text
-                    const label = cb.nextElementSibling || cb.parentElement;
-                    if (label && label.innerText && label.innerText.includes('Todo') && !cb.checked) {
-                        cb.click();
-                    }
-                });
-            }
-        """)
-        time.sleep(2)
-
-        # Take another screenshot
-        page.screenshot(path="data/outputs/inegi_ev_screenshot_3.png")
-
         # Try to find and click a generate/consultar button or scroll to see table
         print("Looking for table or download button...")
 
@@ -112,7 +77,7 @@ def scrape_ev_sales_by_state():
         if download_btn:
             try:
                 download_btn.click(timeout=5000)
-                time.sleep(2)
+                page.wait_for_load_state("networkidle")
                 page.screenshot(path="data/outputs/inegi_ev_screenshot_download.png")
             except:
                 print("Download button not clickable")
@@ -134,11 +99,11 @@ def scrape_ev_sales_by_state():
                 });
             }
         """)
-        time.sleep(2)
+        page.wait_for_load_state("networkidle")
 
         # Scroll down to see if there's a table
         page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(2)
+        page.wait_for_load_state("networkidle")
         page.screenshot(path="data/outputs/inegi_ev_screenshot_bottom.png")
 
         # Try to extract any visible data
@@ -209,8 +174,7 @@ def scrape_ev_sales_by_state():
         }
 
         OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        OUTPUT_FILE.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 
         print(f"Data saved to {OUTPUT_FILE}")
         print(f"Selected years: {page_data.get('selectedYears', [])}")
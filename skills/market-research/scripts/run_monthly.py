@@ -24,10 +24,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.collectors import AutocosmosScraper, INEGICollector
-from src.analyzers import NewCarAnalyzer
-from src.reporters import ExcelReporter, generate_csv_exports
-from src.config import get_config
+# The src package pulls in requests, BeautifulSoup, pandas and the Excel
+# writers, so it is imported inside the steps that use it to keep --help and
+# argument errors instant
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +43,10 @@ def parse_month(month_str: str) -> tuple[int, int]:
 
 def collect_autocosmos(brands: list = None):
     """Collect new car data from Autocosmos"""
+    from src.collectors import AutocosmosScraper
+    from src.config import get_config
+    from src.utils import write_json_array
+
     logger.info("=" * 50)
     logger.info("STEP 1: Collecting Autocosmos new car data")
     logger.info("=" * 50)
@@ -51,66 +54,24 @@ def collect_autocosmos(brands: list = None):
     scraper = AutocosmosScraper()
     config = get_config()
 
-    # Get all brands
-    all_brands = scraper.get_all_brands()
-    logger.info(f"Found {len(all_brands)} brands in catalog")
-
-    # Filter if specified
-    if brands:
-        all_brands = [b for b in all_brands if b["slug"] in brands]
-        logger.info(f"Filtering to {len(all_brands)} specified brands")
-
-    # Collect models
-    catalog = []
-    for brand in all_brands:
-        logger.info(f"Processing {brand['name']}...")
-        models = scraper.get_brand_models(brand["slug"])
-
-        for model_info in models:
-            model = scraper.get_model_details(brand["slug"], model_info["slug"])
-            if model:
-                catalog.append(model)
-
-    # Save catalog
-    import json
     output_dir = config.raw_data_path / "autocosmos"
     output_dir.mkdir(parents=True, exist_ok=True)
     catalog_file = output_dir / f"catalog_{date.today().isoformat()}.json"
 
-    with open(catalog_file, "w", encoding="utf-8") as f:
-        json.dump(
-            [
-                {
-                    "brand": m.brand,
-                    "model": m.model,
-                    "year": m.year,
-                    "body_type": m.body_type.value if m.body_type else None,
-                    "base_price_mxn": str(m.base_price_mxn) if m.base_price_mxn else None,
-                    "transmission": m.transmission.value if m.transmission else None,
-                    "fuel_type": m.fuel_type.value if m.fuel_type else None,
-                    "origin_country": m.origin_country,
-                    "scraped_date": m.scraped_date.isoformat() if m.scraped_date else None,
-                    "versions": [
-                        {
-                            "name": v.name,
-                            "price_mxn": str(v.price_mxn),
-                        }
-                        for v in m.versions
-                    ],
-                }
-                for m in catalog
-            ],
-            f,
-            ensure_ascii=False,
-            indent=2
-        )
-
-    logger.info(f"Saved {len(catalog)} models to {catalog_file}")
+    # Stream models to the catalog as the scraper yields them (in catalog
+    # order, fetched concurrently); Decimal prices are written as strings
+    models = scraper.scrape_all_models(brands)
+    count = write_json_array(catalog_file, models, default=str)
+
+    logger.info(f"Saved {count} models to {catalog_file}")
     return catalog_file
 
 
 def collect_inegi(year: int, month: int):
     """Collect INEGI data"""
+    from src.collectors import INEGICollector
+    from src.config import get_config
+
     logger.info("=" * 50)
     logger.info("STEP 2: Collecting INEGI data")
     logger.info("=" * 50)
@@ -132,6 +93,10 @@ def collect_inegi(year: int, month: int):
 
 def generate_reports(catalog_path: Path = None):
     """Generate all reports"""
+    from src.analyzers import NewCarAnalyzer
+    from src.config import get_config
+    from src.reporters import ExcelReporter, generate_csv_exports
+
     logger.info("=" * 50)
     logger.info("STEP 3: Generating reports")
     logger.info("=" * 50)
@@ -150,11 +115,11 @@ def generate_reports(catalog_path: Path = None):
 
     # Excel report
     reporter = ExcelReporter()
-    excel_file = reporter.generate_new_car_report(catalog_path=catalog_path)
+    excel_file = reporter.generate_new_car_report(analyzer=analyzer)
     logger.info(f"Generated Excel report: {excel_file}")
 
     # CSV exports
-    csv_files = generate_csv_exports(catalog_path)
+    csv_files = generate_csv_exports(analyzer=analyzer)
     logger.info(f"Generated {len(csv_files)} CSV files")
 
     return {
@@ -6,38 +6,57 @@ Analyzes Autocosmos catalog data to produce market insights:
 - Model counts and availability
 - Price bucket analysis
 """
-import json
+import io
 import logging
-from collections import defaultdict
+import re
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal
+from functools import cached_property
 from pathlib import Path
-from statistics import mean, median
 from typing import Optional
 
+import numpy as np
+import orjson
+import pandas as pd
+
 from ..config import get_config
-from ..models import PriceBucket, VehicleType, get_price_bucket
+from ..models import PRICE_BUCKET_NAMES, PRICE_BUCKET_THRESHOLDS
 
 logger = logging.getLogger(__name__)
 
+# Brands the scraper sometimes glues to the model slug ("Chevroletaveo",
+# "Toyota4Runner", "Hondacr-V"); the lookahead leaves bare brand names alone
+_BRAND_RE = re.compile(r"^(Chevrolet|Toyota|Hyundai|Honda|Kia|Mazda|Nissan|Volkswagen)(?=[a-z0-9\-])")
+
+# EV/hybrid keywords in model names, matched as whole words so that e.g.
+# "Every" or "Levante" are not flagged as EVs ("EV6"/"EV9" still are)
+_EV_RE = re.compile(r"\b(ev\d*|eléctrico|electric|e-power)\b", re.I)
+_HYB_RE = re.compile(r"\b(hybrid|híbrido|hev|phev)\b", re.I)
+
 
-@dataclass
+def _fmt_prices(prices: pd.Series) -> pd.Series:
+    """Format a price column as "$1,234,567" strings in one pass"""
+    return prices.map("${:,.0f}".format)
+
+
+@dataclass(slots=True, frozen=True)
 class BrandStats:
     """Statistics for a brand"""
     brand: str
     model_count: int
-    min_price: Decimal
-    max_price: Decimal
-    avg_price: Decimal
-    median_price: Decimal
+    min_price: float
+    max_price: float
+    avg_price: float
+    median_price: float
     price_range: str  # e.g., "$280k - $1.2M"
     body_types: list
     has_ev: bool
     has_hybrid: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SegmentStats:
     """Statistics for a price segment"""
     segment: str
@@ -45,21 +64,21 @@ class SegmentStats:
     model_count: int
     brand_count: int
     brands: list
-    min_price: Decimal
-    max_price: Decimal
-    avg_price: Decimal
+    min_price: float
+    max_price: float
+    avg_price: float
     top_models: list  # [(brand, model, price), ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BodyTypeStats:
     """Statistics for a body type"""
     body_type: str
     model_count: int
     brand_count: int
-    min_price: Decimal
-    max_price: Decimal
-    avg_price: Decimal
+    min_price: float
+    max_price: float
+    avg_price: float
     top_brands: list  # [(brand, count), ...]
 
 
@@ -87,335 +106,340 @@ class NewCarAnalyzer:
             else:
                 raise FileNotFoundError("No catalog files found")
 
+        # The catalog is loaded and cleaned on first use (see catalog/df)
         self.catalog_path = catalog_path
-        self.catalog = self._load_catalog()
-        self._clean_data()
+
+    @cached_property
+    def catalog(self) -> list:
+        """Cleaned catalog records, loaded on first access"""
+        return self._clean(self._load_catalog())
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        """Columnar view of the cleaned catalog, built on first access"""
+        return self._build_frame()
+
+    @cached_property
+    def _priced(self) -> pd.DataFrame:
+        """Models with a price; every price statistic works on these"""
+        return self.df.dropna(subset=["price"])
 
     def _load_catalog(self) -> list:
         """Load catalog from JSON file"""
-        with open(self.catalog_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(Path(self.catalog_path).read_bytes())
 
-    def _clean_data(self):
+    @staticmethod
+    def _clean(catalog: list) -> list:
         """Clean and normalize catalog data"""
-        for car in self.catalog:
-            # Fix brand names that got concatenated
-            brand = car.get("brand", "")
-            model = car.get("model", "")
-
-            # Common brand name fixes
-            brand_fixes = {
-                "Chevroletexpress": "Chevrolet",
-                "Chevroletcorvette": "Chevrolet",
-                "Chevroletaveo": "Chevrolet",
-                "Chevroletblazer": "Chevrolet",
-                "Chevroletcaptiva": "Chevrolet",
-                "Chevroletequinox": "Chevrolet",
-                "Chevrolets10": "Chevrolet",
-                "Chevroletsilverado": "Chevrolet",
-                "Chevroletspark": "Chevrolet",
-                "Chevrolettornado": "Chevrolet",
-                "Toyotacorolla": "Toyota",
-                "Toyota4Runner": "Toyota",
-                "Toyotacamry": "Toyota",
-                "Toyotagr": "Toyota",
-                "Toyotahighlander": "Toyota",
-                "Toyotarav4": "Toyota",
-                "Toyotasequoia": "Toyota",
-                "Toyotasienna": "Toyota",
-                "Toyotatacoma": "Toyota",
-                "Toyotatundra": "Toyota",
-                "Toyotayaris": "Toyota",
-                "Hyundaigrand": "Hyundai",
-                "Hyundaisanta": "Hyundai",
-                "Hyundaicreta": "Hyundai",
-                "Hyundaielantra": "Hyundai",
-                "Hyundaihb20": "Hyundai",
-                "Hyundaiioniq": "Hyundai",
-                "Hyundaipalisade": "Hyundai",
-                "Hyundaitucson": "Hyundai",
-                "Hondaaccord": "Honda",
-                "Hondacivic": "Honda",
-                "Hondacr-V": "Honda",
-                "Kiak4": "Kia",
-                "Kiak3": "Kia",
-                "Kianiro": "Kia",
-                "Kiasportage": "Kia",
-                "Mazda3": "Mazda",
-                "Mazda2": "Mazda",
-                "Nissankicks": "Nissan",
-                "Nissanfrontier": "Nissan",
-                "Nissanx-Trail": "Nissan",
-                "Volkswagencross": "Volkswagen",
-                "Volkswagengolf": "Volkswagen",
-                "Volkswagenjetta": "Volkswagen",
-                "Volkswagenpolo": "Volkswagen",
-            }
-
-            if brand in brand_fixes:
-                car["brand"] = brand_fixes[brand]
-
-            # Ensure price is Decimal
-            if car.get("base_price_mxn"):
-                car["base_price_mxn"] = Decimal(str(car["base_price_mxn"]))
-
-            # Assign price bucket
-            if car.get("base_price_mxn"):
-                bucket = get_price_bucket(car["base_price_mxn"])
-                car["price_bucket"] = bucket.value
+        # Bind the per-car callables once instead of resolving them every iteration
+        brand_match = _BRAND_RE.match
+        ev_search = _EV_RE.search
+        hybrid_search = _HYB_RE.search
+
+        for car in catalog:
+            get = car.get
+            brand = get("brand", "")
+            model = get("model", "") or ""
+
+            # Fix brand names that got the model concatenated (e.g. "Toyotacorolla")
+            m = brand_match(brand or "")
+            if m:
+                car["brand"] = m.group(1)
+
+            # Ensure price is numeric and assign its price bucket
+            price = get("base_price_mxn")
+            if price:
+                car["base_price_mxn"] = price = float(price)
+                if price:
+                    car["price_bucket"] = PRICE_BUCKET_NAMES[bisect_right(PRICE_BUCKET_THRESHOLDS, price)]
 
             # Detect EV/Hybrid from model name
-            model_lower = (model or "").lower()
-            car["is_ev"] = any(x in model_lower for x in ["ev", "eléctrico", "electric", "e-power"])
-            car["is_hybrid"] = any(x in model_lower for x in ["hybrid", "híbrido", "hev", "phev"])
-
-    def get_brand_stats(self) -> list[BrandStats]:
-        """Get statistics by brand"""
-        brand_data = defaultdict(list)
-
-        for car in self.catalog:
-            brand = car.get("brand", "Unknown")
-            if car.get("base_price_mxn"):
-                brand_data[brand].append(car)
-
-        stats = []
-        for brand, cars in sorted(brand_data.items()):
-            prices = [float(c["base_price_mxn"]) for c in cars]
-            body_types = list(set(c.get("body_type") for c in cars if c.get("body_type")))
-
-            stats.append(BrandStats(
-                brand=brand,
-                model_count=len(cars),
-                min_price=Decimal(str(min(prices))),
-                max_price=Decimal(str(max(prices))),
-                avg_price=Decimal(str(int(mean(prices)))),
-                median_price=Decimal(str(int(median(prices)))),
-                price_range=f"${min(prices)/1000:.0f}k - ${max(prices)/1000:.0f}k",
-                body_types=body_types,
-                has_ev=any(c.get("is_ev") for c in cars),
-                has_hybrid=any(c.get("is_hybrid") for c in cars),
-            ))
+            car["is_ev"] = ev_search(model) is not None
+            car["is_hybrid"] = hybrid_search(model) is not None
+
+        return catalog
+
+    def _build_frame(self) -> pd.DataFrame:
+        """Build a columnar view of the cleaned catalog for grouped stats"""
+        catalog = self.catalog
+        df = pd.DataFrame({
+            "brand": [c.get("brand", "Unknown") for c in catalog],
+            "model": [c.get("model") for c in catalog],
+            "body_type": [c.get("body_type") for c in catalog],
+            "price_bucket": [c.get("price_bucket") for c in catalog],
+            "price": [c.get("base_price_mxn") or np.nan for c in catalog],
+            "is_ev": [c["is_ev"] for c in catalog],
+            "is_hybrid": [c["is_hybrid"] for c in catalog],
+        })
+        return df.astype({"brand": "category", "body_type": "category", "price_bucket": "category"})
+
+    @cached_property
+    def brand_stats(self) -> list[BrandStats]:
+        """Statistics by brand (computed once per analyzer)"""
+        # One pass over the priced models computes every per-brand aggregate
+        agg = self._priced.groupby("brand", observed=True).agg(
+            model_count=("price", "count"),
+            min_price=("price", "min"),
+            max_price=("price", "max"),
+            avg_price=("price", "mean"),
+            median_price=("price", "median"),
+            body_types=("body_type", "unique"),
+            has_ev=("is_ev", "any"),
+            has_hybrid=("is_hybrid", "any"),
+        )
+
+        stats = [
+            BrandStats(
+                brand=row.Index,
+                model_count=int(row.model_count),
+                min_price=float(row.min_price),
+                max_price=float(row.max_price),
+                avg_price=float(row.avg_price),
+                median_price=float(row.median_price),
+                price_range=f"${row.min_price/1000:.0f}k - ${row.max_price/1000:.0f}k",
+                body_types=[b for b in row.body_types if pd.notna(b)],
+                has_ev=bool(row.has_ev),
+                has_hybrid=bool(row.has_hybrid),
+            )
+            for row in agg.itertuples()
+        ]
 
         return sorted(stats, key=lambda x: -x.model_count)
 
-    def get_segment_stats(self) -> list[SegmentStats]:
-        """Get statistics by price segment"""
-        segment_data = defaultdict(list)
-
-        for car in self.catalog:
-            bucket = car.get("price_bucket", "unknown")
-            if car.get("base_price_mxn"):
-                segment_data[bucket].append(car)
+    def get_brand_stats(self) -> list[BrandStats]:
+        """Get statistics by brand"""
+        return self.brand_stats
+
+    @cached_property
+    def segment_stats(self) -> list[SegmentStats]:
+        """Statistics by price segment (computed once per analyzer)"""
+        g = self._priced.groupby("price_bucket", observed=True)
+        agg = g.agg(
+            model_count=("price", "count"),
+            min_price=("price", "min"),
+            max_price=("price", "max"),
+            avg_price=("price", "mean"),
+            brands=("brand", "unique"),
+        )
 
         # Order segments
         segment_order = ["entry", "economy", "mid_range", "premium", "luxury", "ultra"]
 
         stats = []
         for segment in segment_order:
-            cars = segment_data.get(segment, [])
-            if not cars:
+            if segment not in agg.index:
                 continue
 
-            prices = [float(c["base_price_mxn"]) for c in cars]
-            brands = list(set(c.get("brand") for c in cars))
+            row = agg.loc[segment]
+            cars = g.get_group(segment)
+            brands = sorted(row.brands)
 
             # Top 5 models by price (most expensive)
-            top_models = sorted(cars, key=lambda x: -float(x["base_price_mxn"]))[:5]
-            top_models_list = [
-                (c["brand"], c["model"], f"${float(c['base_price_mxn']):,.0f}")
-                for c in top_models
-            ]
+            top_models = cars.nlargest(5, "price")
+            top_models_list = list(zip(top_models["brand"], top_models["model"], _fmt_prices(top_models["price"])))
 
             stats.append(SegmentStats(
                 segment=segment,
                 segment_label=self.PRICE_BUCKET_LABELS.get(segment, segment),
-                model_count=len(cars),
+                model_count=int(row.model_count),
                 brand_count=len(brands),
-                brands=sorted(brands),
-                min_price=Decimal(str(min(prices))),
-                max_price=Decimal(str(max(prices))),
-                avg_price=Decimal(str(int(mean(prices)))),
+                brands=brands,
+                min_price=float(row.min_price),
+                max_price=float(row.max_price),
+                avg_price=float(row.avg_price),
                 top_models=top_models_list,
             ))
 
         return stats
 
-    def get_body_type_stats(self) -> list[BodyTypeStats]:
-        """Get statistics by body type"""
-        body_data = defaultdict(list)
+    def get_segment_stats(self) -> list[SegmentStats]:
+        """Get statistics by price segment"""
+        return self.segment_stats
 
-        for car in self.catalog:
-            body_type = car.get("body_type", "unknown")
-            if car.get("base_price_mxn"):
-                body_data[body_type].append(car)
+    @cached_property
+    def body_type_stats(self) -> list[BodyTypeStats]:
+        """Statistics by body type (computed once per analyzer)"""
+        # Group on the categorical codes (-1 = no body type, reported as
+        # "Unknown" like an empty one) rather than hashing the body type strings
+        body_type = self._priced["body_type"].cat
+        g = self._priced.groupby(body_type.codes)
+        agg = g["price"].agg(model_count="count", min_price="min", max_price="max", avg_price="mean")
 
         stats = []
-        for body_type, cars in sorted(body_data.items()):
-            prices = [float(c["base_price_mxn"]) for c in cars]
-
+        for code, row in agg.iterrows():
             # Count by brand
-            brand_counts = defaultdict(int)
-            for c in cars:
-                brand_counts[c.get("brand", "Unknown")] += 1
-
-            top_brands = sorted(brand_counts.items(), key=lambda x: -x[1])[:5]
+            brand_counts = Counter(g.get_group(code)["brand"])
+            top_brands = brand_counts.most_common(5)
 
+            name = body_type.categories[code] if code >= 0 else None
             stats.append(BodyTypeStats(
-                body_type=body_type or "Unknown",
-                model_count=len(cars),
-                brand_count=len(set(c.get("brand") for c in cars)),
-                min_price=Decimal(str(min(prices))),
-                max_price=Decimal(str(max(prices))),
-                avg_price=Decimal(str(int(mean(prices)))),
+                body_type=name or "Unknown",
+                model_count=int(row.model_count),
+                brand_count=len(brand_counts),
+                min_price=float(row.min_price),
+                max_price=float(row.max_price),
+                avg_price=float(row.avg_price),
                 top_brands=top_brands,
             ))
 
-        return sorted(stats, key=lambda x: -x.model_count)
+        return sorted(stats, key=lambda x: (-x.model_count, x.body_type))
 
-    def get_ev_hybrid_stats(self) -> dict:
-        """Get EV and hybrid vehicle statistics"""
-        evs = [c for c in self.catalog if c.get("is_ev")]
-        hybrids = [c for c in self.catalog if c.get("is_hybrid")]
-        total = len(self.catalog)
+    def get_body_type_stats(self) -> list[BodyTypeStats]:
+        """Get statistics by body type"""
+        return self.body_type_stats
+
+    @cached_property
+    def ev_hybrid_stats(self) -> dict:
+        """EV and hybrid vehicle statistics (computed once per analyzer)"""
+        df = self.df
+        evs = df[df["is_ev"]]
+        hybrids = df[df["is_hybrid"]]
+        total = len(df)
 
-        ev_prices = [float(c["base_price_mxn"]) for c in evs if c.get("base_price_mxn")]
-        hybrid_prices = [float(c["base_price_mxn"]) for c in hybrids if c.get("base_price_mxn")]
+        ev_prices = evs["price"].dropna().to_numpy()
+        hybrid_prices = hybrids["price"].dropna().to_numpy()
 
         return {
             "total_models": total,
             "ev_count": len(evs),
             "ev_pct": len(evs) / total * 100 if total else 0,
-            "ev_avg_price": mean(ev_prices) if ev_prices else 0,
-            "ev_brands": list(set(c.get("brand") for c in evs)),
+            "ev_avg_price": float(ev_prices.mean()) if ev_prices.size else 0,
+            "ev_brands": list(evs["brand"].unique()),
             "hybrid_count": len(hybrids),
             "hybrid_pct": len(hybrids) / total * 100 if total else 0,
-            "hybrid_avg_price": mean(hybrid_prices) if hybrid_prices else 0,
-            "hybrid_brands": list(set(c.get("brand") for c in hybrids)),
+            "hybrid_avg_price": float(hybrid_prices.mean()) if hybrid_prices.size else 0,
+            "hybrid_brands": list(hybrids["brand"].unique()),
         }
 
+    def get_ev_hybrid_stats(self) -> dict:
+        """Get EV and hybrid vehicle statistics"""
+        return self.ev_hybrid_stats
+
     def get_cheapest_by_brand(self, n: int = 3) -> dict:
         """Get cheapest models per brand"""
-        brand_models = defaultdict(list)
-
-        for car in self.catalog:
-            if car.get("base_price_mxn"):
-                brand_models[car.get("brand", "Unknown")].append(car)
-
-        result = {}
-        for brand, cars in brand_models.items():
-            sorted_cars = sorted(cars, key=lambda x: float(x["base_price_mxn"]))
-            result[brand] = [
-                {
-                    "model": c["model"],
-                    "price": f"${float(c['base_price_mxn']):,.0f}",
-                    "body_type": c.get("body_type", "N/A"),
-                }
-                for c in sorted_cars[:n]
-            ]
-
-        return result
-
-    def get_summary(self) -> dict:
-        """Get overall market summary"""
-        prices = [float(c["base_price_mxn"]) for c in self.catalog if c.get("base_price_mxn")]
-        brands = list(set(c.get("brand") for c in self.catalog))
+        # One stable sort of the priced models, then the first n rows of each brand
+        cheapest = (
+            self._priced.sort_values("price", kind="stable")
+            .groupby("brand", observed=True, sort=False)
+            .head(n)
+        )
+
+        result = defaultdict(list)
+        for brand, model, price, body_type in zip(
+            cheapest["brand"], cheapest["model"], _fmt_prices(cheapest["price"]), cheapest["body_type"]
+        ):
+            result[brand].append({
+                "model": model,
+                "price": price,
+                "body_type": body_type if pd.notna(body_type) else "N/A",
+            })
+
+        return dict(result)
+
+    @cached_property
+    def summary(self) -> dict:
+        """Overall market summary (computed once per analyzer)"""
+        prices = self._priced["price"].to_numpy()
+        # The brand column is categorical, so its categories are the sorted distinct brands
+        brands = list(self.df["brand"].cat.categories)
 
         return {
             "catalog_date": self.catalog_path.stem.replace("catalog_", ""),
             "total_models": len(self.catalog),
             "total_brands": len(brands),
-            "brands": sorted(brands),
-            "price_min": f"${min(prices):,.0f}",
-            "price_max": f"${max(prices):,.0f}",
-            "price_avg": f"${mean(prices):,.0f}",
-            "price_median": f"${median(prices):,.0f}",
+            "brands": brands,
+            "price_min": f"${prices.min():,.0f}",
+            "price_max": f"${prices.max():,.0f}",
+            "price_avg": f"${prices.mean():,.0f}",
+            "price_median": f"${np.median(prices):,.0f}",
         }
 
+    def get_summary(self) -> dict:
+        """Get overall market summary"""
+        return self.summary
+
     def generate_report(self) -> str:
         """Generate a text report"""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
+        rule = "=" * 70
+        section = "-" * 40
 
         # Header
-        lines.append("=" * 70)
-        lines.append("KAVAK MARKET RESEARCH - NEW CAR ANALYSIS")
-        lines.append(f"Report Date: {date.today().isoformat()}")
-        lines.append("=" * 70)
-        lines.append("")
+        w(f"{rule}\nKAVAK MARKET RESEARCH - NEW CAR ANALYSIS\nReport Date: {date.today().isoformat()}\n{rule}\n\n")
 
         # Summary
-        summary = self.get_summary()
-        lines.append("MARKET OVERVIEW")
-        lines.append("-" * 40)
-        lines.append(f"Total Models Analyzed: {summary['total_models']}")
-        lines.append(f"Total Brands: {summary['total_brands']}")
-        lines.append(f"Price Range: {summary['price_min']} - {summary['price_max']} MXN")
-        lines.append(f"Average Price: {summary['price_avg']} MXN")
-        lines.append(f"Median Price: {summary['price_median']} MXN")
-        lines.append("")
+        summary = self.summary
+        w(
+            f"MARKET OVERVIEW\n{section}\n"
+            f"Total Models Analyzed: {summary['total_models']}\n"
+            f"Total Brands: {summary['total_brands']}\n"
+            f"Price Range: {summary['price_min']} - {summary['price_max']} MXN\n"
+            f"Average Price: {summary['price_avg']} MXN\n"
+            f"Median Price: {summary['price_median']} MXN\n\n"
+        )
 
         # Brand Analysis
-        lines.append("ANALYSIS BY BRAND")
-        lines.append("-" * 40)
-        lines.append(f"{'Brand':<15} {'Models':>8} {'Min Price':>12} {'Max Price':>12} {'Avg Price':>12}")
-        lines.append("-" * 60)
-
-        for stat in self.get_brand_stats():
+        w(
+            f"ANALYSIS BY BRAND\n{section}\n"
+            f"{'Brand':<15} {'Models':>8} {'Min Price':>12} {'Max Price':>12} {'Avg Price':>12}\n"
+            f"{'-' * 60}\n"
+        )
+        for stat in self.brand_stats:
             ev_tag = " [EV]" if stat.has_ev else ""
             hybrid_tag = " [HYB]" if stat.has_hybrid else ""
-            lines.append(
+            w(
                 f"{stat.brand:<15} {stat.model_count:>8} "
-                f"${float(stat.min_price)/1000:>9.0f}k "
-                f"${float(stat.max_price)/1000:>9.0f}k "
-                f"${float(stat.avg_price)/1000:>9.0f}k"
-                f"{ev_tag}{hybrid_tag}"
+                f"${stat.min_price/1000:>9.0f}k "
+                f"${stat.max_price/1000:>9.0f}k "
+                f"${stat.avg_price/1000:>9.0f}k"
+                f"{ev_tag}{hybrid_tag}\n"
             )
-        lines.append("")
+        w("\n")
 
         # Segment Analysis
-        lines.append("ANALYSIS BY PRICE SEGMENT")
-        lines.append("-" * 40)
-
-        for stat in self.get_segment_stats():
-            lines.append(f"\n{stat.segment_label}")
-            lines.append(f"  Models: {stat.model_count} from {stat.brand_count} brands")
-            lines.append(f"  Price Range: ${float(stat.min_price):,.0f} - ${float(stat.max_price):,.0f}")
-            lines.append(f"  Brands: {', '.join(stat.brands[:5])}{'...' if len(stat.brands) > 5 else ''}")
-            lines.append("  Top Models:")
+        w(f"ANALYSIS BY PRICE SEGMENT\n{section}\n")
+        for stat in self.segment_stats:
+            w(
+                f"\n{stat.segment_label}\n"
+                f"  Models: {stat.model_count} from {stat.brand_count} brands\n"
+                f"  Price Range: ${stat.min_price:,.0f} - ${stat.max_price:,.0f}\n"
+                f"  Brands: {', '.join(stat.brands[:5])}{'...' if len(stat.brands) > 5 else ''}\n"
+                f"  Top Models:\n"
+            )
             for brand, model, price in stat.top_models[:3]:
-                lines.append(f"    - {brand} {model}: {price}")
-        lines.append("")
+                w(f"    - {brand} {model}: {price}\n")
+        w("\n")
 
         # EV/Hybrid Analysis
-        ev_stats = self.get_ev_hybrid_stats()
-        lines.append("ELECTRIC & HYBRID VEHICLES")
-        lines.append("-" * 40)
-        lines.append(f"Electric Vehicles: {ev_stats['ev_count']} models ({ev_stats['ev_pct']:.1f}%)")
+        ev_stats = self.ev_hybrid_stats
+        w(
+            f"ELECTRIC & HYBRID VEHICLES\n{section}\n"
+            f"Electric Vehicles: {ev_stats['ev_count']} models ({ev_stats['ev_pct']:.1f}%)\n"
+        )
         if ev_stats['ev_avg_price']:
-            lines.append(f"  Average EV Price: ${ev_stats['ev_avg_price']:,.0f} MXN")
-        lines.append(f"  Brands with EVs: {', '.join(ev_stats['ev_brands'])}")
-        lines.append("")
-        lines.append(f"Hybrid Vehicles: {ev_stats['hybrid_count']} models ({ev_stats['hybrid_pct']:.1f}%)")
+            w(f"  Average EV Price: ${ev_stats['ev_avg_price']:,.0f} MXN\n")
+        w(
+            f"  Brands with EVs: {', '.join(ev_stats['ev_brands'])}\n\n"
+            f"Hybrid Vehicles: {ev_stats['hybrid_count']} models ({ev_stats['hybrid_pct']:.1f}%)\n"
+        )
         if ev_stats['hybrid_avg_price']:
-            lines.append(f"  Average Hybrid Price: ${ev_stats['hybrid_avg_price']:,.0f} MXN")
-        lines.append(f"  Brands with Hybrids: {', '.join(ev_stats['hybrid_brands'])}")
-        lines.append("")
+            w(f"  Average Hybrid Price: ${ev_stats['hybrid_avg_price']:,.0f} MXN\n")
+        w(f"  Brands with Hybrids: {', '.join(ev_stats['hybrid_brands'])}\n\n")
 
         # Cheapest Entry Points
-        lines.append("CHEAPEST ENTRY POINTS BY BRAND")
-        lines.append("-" * 40)
+        w(f"CHEAPEST ENTRY POINTS BY BRAND\n{section}\n")
         cheapest = self.get_cheapest_by_brand(2)
         for brand in sorted(cheapest.keys()):
             models = cheapest[brand]
             if models:
                 model_str = ", ".join(f"{m['model']} ({m['price']})" for m in models)
-                lines.append(f"{brand}: {model_str}")
-        lines.append("")
+                w(f"{brand}: {model_str}\n")
+        w("\n")
 
-        lines.append("=" * 70)
-        lines.append("End of Report")
-        lines.append("=" * 70)
+        w(f"{rule}\nEnd of Report\n{rule}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 def main():
@@ -8,19 +8,23 @@ Extracts:
 - MSRP prices by version/trim
 - Specifications (engine, transmission, body type)
 """
-import json
+import html
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 from typing import Generator, Optional
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 from ..config import get_config
 from ..models import (
@@ -30,6 +34,7 @@ from ..models import (
     Transmission,
     VehicleType,
 )
+from ..utils import write_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +47,54 @@ class AutocosmosScraper:
     BRANDS_URL = "https://www.autocosmos.com.mx/catalogo/vigente"
 
     # Rate limiting
-    REQUEST_DELAY = 1.0  # seconds between requests
+    REQUEST_DELAY = 1.0  # seconds between request starts
+    MAX_IN_FLIGHT = 8  # concurrent requests, independent of the start rate
+
+    # Every catalog link (brands and models) lives under this path
+    CATALOG_LINK_SELECTOR = 'a[href*="/catalogo/vigente/" i]'
+
+    # Precompiled patterns for link, price and spec extraction
+    _BRAND_HREF_RE = re.compile(r"/catalogo/vigente/([a-z0-9-]+)$", re.I)
+    _BREADCRUMB_HREF_RE = re.compile(r"/catalogo/(sedan|suv|pickup|hatchback)", re.I)
+    _PRICE_TEXT_RE = re.compile(r"\$[\d,]+")
+    _INLINE_PRICE_RE = re.compile(r"([\w\s-]+)\s*\$\s*([\d,]+)")
+    _THOUSANDS_RE = re.compile(r"\d{3},\d{3}")
+    _NON_DIGIT_RE = re.compile(r"[^\d]")
+    _YEAR_RE = re.compile(r"20\d{2}")
+    # Same pattern over the raw body, so the page is never decoded to str
+    _YEAR_BYTES_RE = re.compile(rb"20[0-9]{2}")
+    _HP_RE = re.compile(r"(\d+)\s*(hp|cv)")
+    _DISPLACEMENT_RE = re.compile(r"\d\.\d")
+    # Engine patterns like "1.6L", "2.0T", "V6", "1500cc", in priority order.
+    # Kept as separate searches: a single alternation would return the
+    # earliest match rather than the highest-priority one, and measured
+    # slower than three prefix-optimized scans
+    _ENGINE_RES = tuple(
+        re.compile(pattern, re.I)
+        for pattern in (r"\d\.\d\s*[LT]", r"V\d", r"\d{3,4}\s*cc")
+    )
+
+    # Brand links on the catalog index, the only part of it get_all_brands reads
+    _BRAND_LINK_STRAINER = SoupStrainer("a", href=_BRAND_HREF_RE)
+
+    # Brand anchors matched directly in the catalog index HTML, plus the bits
+    # needed to recover their text the way BeautifulSoup would
+    _BRAND_ANCHOR_RE = re.compile(
+        r"""<a\s(?:[^>]*?\s)?href=["']([^"']*/catalogo/vigente/([a-z0-9-]+))["'][^>]*>(.*?)</a>""",
+        re.I | re.S,
+    )
+    _TAG_RE = re.compile(r"<[^>]*>")
+    _IMG_TAG_RE = re.compile(r"<img\s[^>]*>", re.I)
+    _ALT_ATTR_RE = re.compile(r"""\salt=["']([^"']*)["']""", re.I)
+
+    # How long cached pages stay fresh (only used if requests-cache is installed)
+    HTTP_CACHE_EXPIRE = timedelta(hours=12)
+
+    # Models scraped between progress file updates
+    PROGRESS_EVERY = 50
+
+    # Connection pool size; also the max worker threads callers should use
+    POOL_SIZE = 16
 
     # Body type mapping from URL segments to our enum
     BODY_TYPE_MAP = {
@@ -81,9 +133,44 @@ class AutocosmosScraper:
         "electric": FuelType.ELECTRIC,
     }
 
+    # Country of origin mapping
+    ORIGIN_MAP = {
+        "hecho en méxico": "Mexico",
+        "made in mexico": "Mexico",
+        "fabricado en méxico": "Mexico",
+        "importado": "Imported",
+        "china": "China",
+        "india": "India",
+        "japón": "Japan",
+        "japan": "Japan",
+        "corea": "South Korea",
+        "korea": "South Korea",
+        "usa": "USA",
+        "estados unidos": "USA",
+    }
+
+    # Keyword maps scanned in page text; within each map the first keyword
+    # (in insertion order) found anywhere on the page wins
+    _METADATA_MAPS = {
+        "body_type": BODY_TYPE_MAP,
+        "transmission": TRANSMISSION_MAP,
+        "fuel_type": FUEL_TYPE_MAP,
+        "origin": ORIGIN_MAP,
+    }
+    # Every (keyword, category, value), each map's entries in priority order,
+    # so one walk with plain substring checks settles all four categories.
+    # Each check is a C-level str search, so ~40 keywords over a model page
+    # cost well under a millisecond; a multi-pattern engine (regex
+    # alternation, Aho-Corasick, Hyperscan) is not worth a dependency here
+    _METADATA_KEYWORDS = tuple(
+        (keyword, category, value)
+        for category, keyword_map in _METADATA_MAPS.items()
+        for keyword, value in keyword_map.items()
+    )
+
     def __init__(self):
         self.config = get_config()
-        self.session = requests.Session()
+        self.session = self._make_session()
         self.session.headers.update({
             "User-Agent": (
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -93,22 +180,71 @@ class AutocosmosScraper:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "es-MX,es;q=0.9,en;q=0.8",
         })
-        self._last_request_time = 0
+        # Every request goes to one host over HTTP/1.1 keep-alive; pool_block
+        # makes threads wait for a warm pooled connection instead of opening
+        # (and then discarding) extra ones when the pool is momentarily busy
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+
+    def _make_session(self) -> requests.Session:
+        """Create the HTTP session, cached on disk when requests-cache is installed"""
+        try:
+            import requests_cache
+        except ImportError:
+            return requests.Session()
+
+        cache_path = self.config.raw_data_path / "autocosmos" / "http_cache.sqlite"
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # cache_control honours the site's Cache-Control/ETag headers, so stale
+        # entries are revalidated with a conditional GET instead of refetched
+        return requests_cache.CachedSession(
+            str(cache_path),
+            expire_after=self.HTTP_CACHE_EXPIRE,
+            cache_control=True,
+        )
 
     def _rate_limit(self):
-        """Apply rate limiting between requests"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.REQUEST_DELAY:
-            time.sleep(self.REQUEST_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """Wait for this request's start slot (safe to call from threads)"""
+        # Reserve the next slot under the lock but sleep outside it, so
+        # waiting threads queue up without serializing on the lock itself
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self.REQUEST_DELAY
+        if slot > now:
+            time.sleep(slot - now)
 
     def _get(self, url: str) -> requests.Response:
-        """Make a rate-limited GET request"""
+        """Make a GET request, rate-limited unless served fresh from the HTTP cache"""
+        if hasattr(self.session, "cache"):
+            # only_if_cached answers a missing or expired entry with a 504
+            # instead of going to the network, so only fresh hits skip the
+            # throttle; revalidating an expired entry is a real request
+            response = self.session.get(url, timeout=30, only_if_cached=True)
+            if response.status_code != 504:
+                response.raise_for_status()
+                return response
+
         self._rate_limit()
-        response = self.session.get(url, timeout=30)
+        with self._in_flight:
+            response = self.session.get(url, timeout=30)
         response.raise_for_status()
         return response
 
+    def _soup(
+        self, response: requests.Response, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """Parse a response with lxml, letting it sniff the charset from the raw bytes"""
+        return BeautifulSoup(response.content, "lxml", parse_only=parse_only)
+
     def get_all_brands(self) -> list[dict]:
         """
         Get list of all brands available in the catalog
@@ -117,51 +253,72 @@ class AutocosmosScraper:
             List of dicts with brand name and URL
         """
         logger.info("Fetching all brands from Autocosmos catalog")
-        brands = []
+        brands = {}  # slug -> brand info; the first link to each brand wins
 
         try:
             response = self._get(self.CATALOG_URL)
-            soup = BeautifulSoup(response.text, "html.parser")
 
             # Find brand links - they're typically in a list or grid
             # URL pattern: /catalogo/vigente/{brand}
-            brand_pattern = re.compile(r"/catalogo/vigente/([a-z0-9-]+)$", re.I)
-
-            for link in soup.find_all("a", href=brand_pattern):
-                href = link.get("href", "")
-                match = brand_pattern.search(href)
-                if match:
-                    brand_slug = match.group(1)
-                    brand_name = link.get_text(strip=True)
-                    if not brand_name:
-                        # Try to get from image alt or nearby text
-                        img = link.find("img")
-                        if img:
-                            brand_name = img.get("alt", brand_slug)
-
-                    brand_name = brand_name or brand_slug.replace("-", " ").title()
-
-                    brands.append({
-                        "name": brand_name,
+            for href, brand_slug, brand_name in self._brand_links(response):
+                if brand_slug not in brands:
+                    brands[brand_slug] = {
+                        "name": brand_name or brand_slug.replace("-", " ").title(),
                         "slug": brand_slug,
                         "url": urljoin(self.BASE_URL, href),
-                    })
-
-            # Remove duplicates
-            seen = set()
-            unique_brands = []
-            for brand in brands:
-                if brand["slug"] not in seen:
-                    seen.add(brand["slug"])
-                    unique_brands.append(brand)
+                    }
 
-            logger.info(f"Found {len(unique_brands)} brands")
-            return sorted(unique_brands, key=lambda x: x["name"])
+            logger.info(f"Found {len(brands)} brands")
+            return sorted(brands.values(), key=lambda x: x["name"])
 
         except Exception as e:
             logger.error(f"Error fetching brands: {e}")
             return []
 
+    def _brand_links(self, response: requests.Response) -> Generator[tuple, None, None]:
+        """
+        Yield (href, slug, name) for every brand link on the catalog index
+
+        Anchors are matched straight off the raw HTML, which skips building a
+        DOM; if that finds nothing (e.g. after a site redesign) the page is
+        parsed with BeautifulSoup instead. name is empty when neither the link
+        text nor an image alt gives one.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        html_text = response.content.decode(
+            response.encoding if "charset" in content_type else "utf-8", "replace"
+        )
+        anchors = self._BRAND_ANCHOR_RE.findall(html_text)
+        if anchors:
+            for href, brand_slug, inner in anchors:
+                # Same result as BeautifulSoup's get_text(strip=True)
+                name = "".join(
+                    html.unescape(part).strip() for part in self._TAG_RE.split(inner)
+                )
+                if not name:
+                    # Try to get from image alt
+                    img = self._IMG_TAG_RE.search(inner)
+                    if img:
+                        alt = self._ALT_ATTR_RE.search(img.group())
+                        name = html.unescape(alt.group(1)) if alt else brand_slug
+                yield html.unescape(href), brand_slug, name
+            return
+
+        # Only brand links (and their contents) are needed from this page
+        soup = self._soup(response, parse_only=self._BRAND_LINK_STRAINER)
+        for link in soup.select(self.CATALOG_LINK_SELECTOR):
+            href = link.get("href", "")
+            match = self._BRAND_HREF_RE.search(href)
+            if match:
+                brand_slug = match.group(1)
+                name = link.get_text(strip=True)
+                if not name:
+                    # Try to get from image alt or nearby text
+                    img = link.find("img")
+                    if img:
+                        name = img.get("alt", brand_slug)
+                yield href, brand_slug, name
+
     def get_brand_models(self, brand_slug: str) -> list[dict]:
         """
         Get all models for a specific brand
@@ -173,24 +330,27 @@ class AutocosmosScraper:
             List of model info dicts
         """
         logger.info(f"Fetching models for brand: {brand_slug}")
-        models = []
+        models = {}  # slug -> model info; the first link to each model wins
 
         brand_url = f"{self.BASE_URL}/catalogo/vigente/{brand_slug}"
 
         try:
             response = self._get(brand_url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self._soup(response)
 
             # Find model links
             # URL pattern: /catalogo/vigente/{brand}/{model}
             model_pattern = re.compile(
-                rf"/catalogo/vigente/{brand_slug}/([a-z0-9-]+)$", re.I
+                rf"/catalogo/vigente/{re.escape(brand_slug)}/([a-z0-9-]+)$", re.I
             )
 
-            for link in soup.find_all("a", href=model_pattern):
+            # Cards usually link the same model several times (image, title,
+            # "ver más"); only the first link is kept, so skip the rest before
+            # walking up to its container for the price
+            for link in soup.select(self.CATALOG_LINK_SELECTOR):
                 href = link.get("href", "")
                 match = model_pattern.search(href)
-                if match:
+                if match and match.group(1) not in models:
                     model_slug = match.group(1)
                     model_name = link.get_text(strip=True)
 
@@ -198,27 +358,19 @@ class AutocosmosScraper:
                     price = None
                     parent = link.find_parent(["div", "article", "li"])
                     if parent:
-                        price_elem = parent.find(string=re.compile(r"\$[\d,]+"))
+                        price_elem = parent.find(string=self._PRICE_TEXT_RE)
                         if price_elem:
                             price = self._parse_price(price_elem)
 
-                    models.append({
+                    models[model_slug] = {
                         "name": model_name or model_slug.replace("-", " ").title(),
                         "slug": model_slug,
                         "url": urljoin(self.BASE_URL, href),
                         "base_price": price,
-                    })
-
-            # Remove duplicates
-            seen = set()
-            unique_models = []
-            for model in models:
-                if model["slug"] not in seen:
-                    seen.add(model["slug"])
-                    unique_models.append(model)
+                    }
 
-            logger.info(f"Found {len(unique_models)} models for {brand_slug}")
-            return unique_models
+            logger.info(f"Found {len(models)} models for {brand_slug}")
+            return list(models.values())
 
         except Exception as e:
             logger.error(f"Error fetching models for {brand_slug}: {e}")
@@ -240,7 +392,7 @@ class AutocosmosScraper:
 
         try:
             response = self._get(model_url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self._soup(response)
 
             # Extract model info
             brand_name = brand_slug.replace("-", " ").title()
@@ -255,18 +407,22 @@ class AutocosmosScraper:
                 if len(parts) >= 2:
                     brand_name = parts[0]
                     # Model is everything between brand and year
-                    year_match = re.search(r"20\d{2}", title_text)
+                    year_match = self._YEAR_RE.search(title_text)
                     if year_match:
                         model_name = title_text[len(brand_name):year_match.start()].strip()
 
             # Get current year
             year = date.today().year
-            year_match = re.search(r"20\d{2}", response.text)
+            year_match = self._YEAR_BYTES_RE.search(response.content)
             if year_match:
                 year = int(year_match.group())
 
+            # Page text is shared by the version fallback and every spec helper
+            text = soup.get_text()
+            text_lower = text.lower()
+
             # Extract versions and prices
-            versions = self._extract_versions(soup)
+            versions = self._extract_versions(soup, text)
 
             # Get base price (lowest version price)
             base_price = None
@@ -274,11 +430,12 @@ class AutocosmosScraper:
                 base_price = min(v.price_mxn for v in versions)
 
             # Extract specs
-            body_type = self._extract_body_type(soup)
-            engine = self._extract_engine(soup)
-            transmission = self._extract_transmission(soup)
-            fuel_type = self._extract_fuel_type(soup)
-            origin = self._extract_origin(soup)
+            metadata = self._scan_metadata(text_lower)
+            body_type = metadata["body_type"] or self._extract_body_type(soup)
+            engine = self._extract_engine(text)
+            transmission = metadata["transmission"]
+            fuel_type = metadata["fuel_type"] or FuelType.GASOLINE  # Default assumption
+            origin = metadata["origin"]
 
             return NewCarModel(
                 brand=brand_name,
@@ -298,8 +455,8 @@ class AutocosmosScraper:
             logger.error(f"Error fetching model details for {brand_slug}/{model_slug}: {e}")
             return None
 
-    def _extract_versions(self, soup: BeautifulSoup) -> list[NewCarVersion]:
-        """Extract all versions/trims with prices"""
+    def _extract_versions(self, soup: BeautifulSoup, text: str) -> list[NewCarVersion]:
+        """Extract all versions/trims with prices (text is the page's get_text())"""
         versions = []
 
         # Look for version tables or lists
@@ -307,57 +464,56 @@ class AutocosmosScraper:
         # or repeated div/article elements
 
         # Try table first
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    name_cell = cells[0].get_text(strip=True)
-                    price_cell = None
-                    for cell in cells[1:]:
-                        text = cell.get_text(strip=True)
-                        if "$" in text or re.search(r"\d{3},\d{3}", text):
-                            price_cell = text
-                            break
-
-                    if name_cell and price_cell:
-                        price = self._parse_price(price_cell)
-                        if price:
-                            # Extract specs from row if available
-                            engine = None
-                            hp = None
-                            trans = None
-
-                            for cell in cells:
-                                text = cell.get_text(strip=True).lower()
-                                if "hp" in text or "cv" in text:
-                                    hp_match = re.search(r"(\d+)\s*(hp|cv)", text)
-                                    if hp_match:
-                                        hp = int(hp_match.group(1))
-                                if "l" in text and re.search(r"\d\.\d", text):
-                                    engine = text
-                                if "manual" in text:
-                                    trans = Transmission.MANUAL
-                                elif "auto" in text or "cvt" in text:
-                                    trans = Transmission.CVT if "cvt" in text else Transmission.AUTOMATIC
-
-                            versions.append(NewCarVersion(
-                                name=name_cell,
-                                price_mxn=price,
-                                engine=engine,
-                                horsepower=hp,
-                                transmission=trans,
-                            ))
+        for row in soup.select("table tr"):
+            # Each cell's text is extracted once and reused for every check
+            cell_texts = [cell.get_text(strip=True) for cell in row.select("td, th")]
+            if len(cell_texts) >= 2:
+                name_cell = cell_texts[0]
+                price_cell = next(
+                    (
+                        cell_text for cell_text in cell_texts[1:]
+                        if "$" in cell_text or self._THOUSANDS_RE.search(cell_text)
+                    ),
+                    None,
+                )
+
+                if name_cell and price_cell:
+                    price = self._parse_price(price_cell)
+                    if price:
+                        # Extract specs from row if available
+                        engine = None
+                        hp = None
+                        trans = None
+
+                        for cell_text in map(str.lower, cell_texts):
+                            if "hp" in cell_text or "cv" in cell_text:
+                                hp_match = self._HP_RE.search(cell_text)
+                                if hp_match:
+                                    hp = int(hp_match.group(1))
+                            if "l" in cell_text and self._DISPLACEMENT_RE.search(cell_text):
+                                engine = cell_text
+                            if "manual" in cell_text:
+                                trans = Transmission.MANUAL
+                            elif "auto" in cell_text or "cvt" in cell_text:
+                                trans = Transmission.CVT if "cvt" in cell_text else Transmission.AUTOMATIC
+
+                        versions.append(NewCarVersion(
+                            name=name_cell,
+                            price_mxn=price,
+                            engine=engine,
+                            horsepower=hp,
+                            transmission=trans,
+                        ))
 
         # If no table, try divs/articles
         if not versions:
             # Look for price patterns in the page
-            price_pattern = re.compile(r"([\w\s-]+)\s*\$\s*([\d,]+)")
-            text = soup.get_text()
-            for match in price_pattern.finditer(text):
+            for match in self._INLINE_PRICE_RE.finditer(text):
                 name = match.group(1).strip()
-                price = self._parse_price(f"${match.group(2)}")
+                # The captured amount is only digits and commas, so it needs
+                # no regex cleanup before conversion
+                digits = match.group(2).replace(",", "")
+                price = Decimal(digits) if digits else None
                 if price and len(name) > 2 and len(name) < 50:
                     versions.append(NewCarVersion(
                         name=name,
@@ -374,16 +530,28 @@ class AutocosmosScraper:
 
         return unique_versions
 
-    def _extract_body_type(self, soup: BeautifulSoup) -> Optional[VehicleType]:
-        """Extract body type from page"""
-        text = soup.get_text().lower()
+    def _scan_metadata(self, text_lower: str) -> dict:
+        """
+        Find body type, transmission, fuel type and origin in one pass
+
+        Args:
+            text_lower: Lowercased page text
+
+        Returns:
+            Dict keyed by _METADATA_MAPS category, None where nothing matched
+        """
+        found = {}
+        for keyword, category, value in self._METADATA_KEYWORDS:
+            if category not in found and keyword in text_lower:
+                found[category] = value
+                if len(found) == len(self._METADATA_MAPS):
+                    break
 
-        for keyword, body_type in self.BODY_TYPE_MAP.items():
-            if keyword in text:
-                return body_type
+        return {category: found.get(category) for category in self._METADATA_MAPS}
 
-        # Check URL/breadcrumbs
-        breadcrumbs = soup.find_all("a", href=re.compile(r"/catalogo/(sedan|suv|pickup|hatchback)", re.I))
+    def _extract_body_type(self, soup: BeautifulSoup) -> Optional[VehicleType]:
+        """Extract body type from URL/breadcrumb links"""
+        breadcrumbs = soup.find_all("a", href=self._BREADCRUMB_HREF_RE)
         for bc in breadcrumbs:
             href = bc.get("href", "").lower()
             for keyword, body_type in self.BODY_TYPE_MAP.items():
@@ -392,82 +560,24 @@ class AutocosmosScraper:
 
         return None
 
-    def _extract_engine(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract engine info"""
-        # Look for patterns like "1.6L", "2.0T", "V6"
-        patterns = [
-            r"\d\.\d\s*[LT]",
-            r"V\d",
-            r"\d{3,4}\s*cc",
-        ]
-
-        text = soup.get_text()
-        for pattern in patterns:
-            match = re.search(pattern, text, re.I)
+    def _extract_engine(self, text: str) -> Optional[str]:
+        """Extract engine info from page text"""
+        for pattern in self._ENGINE_RES:
+            match = pattern.search(text)
             if match:
                 return match.group().strip()
 
         return None
 
-    def _extract_transmission(self, soup: BeautifulSoup) -> Optional[Transmission]:
-        """Extract transmission type"""
-        text = soup.get_text().lower()
-
-        for keyword, trans in self.TRANSMISSION_MAP.items():
-            if keyword in text:
-                return trans
-
-        return None
-
-    def _extract_fuel_type(self, soup: BeautifulSoup) -> Optional[FuelType]:
-        """Extract fuel type"""
-        text = soup.get_text().lower()
-
-        for keyword, fuel in self.FUEL_TYPE_MAP.items():
-            if keyword in text:
-                return fuel
-
-        return FuelType.GASOLINE  # Default assumption
-
-    def _extract_origin(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract country of origin"""
-        text = soup.get_text().lower()
-
-        origins = {
-            "hecho en méxico": "Mexico",
-            "made in mexico": "Mexico",
-            "fabricado en méxico": "Mexico",
-            "importado": "Imported",
-            "china": "China",
-            "india": "India",
-            "japón": "Japan",
-            "japan": "Japan",
-            "corea": "South Korea",
-            "korea": "South Korea",
-            "usa": "USA",
-            "estados unidos": "USA",
-        }
-
-        for keyword, origin in origins.items():
-            if keyword in text:
-                return origin
-
-        return None
-
     def _parse_price(self, price_text: str) -> Optional[Decimal]:
         """Parse price string to Decimal"""
         if not price_text:
             return None
 
-        # Extract numbers from string like "$362,900" or "362900"
-        cleaned = re.sub(r"[^\d]", "", price_text)
-        if cleaned:
-            try:
-                return Decimal(cleaned)
-            except Exception:
-                pass
-
-        return None
+        # Extract numbers from string like "$362,900" or "362900"; what is
+        # left is only decimal digits, so Decimal() cannot fail on it
+        cleaned = self._NON_DIGIT_RE.sub("", price_text)
+        return Decimal(cleaned) if cleaned else None
 
     def scrape_all_models(
         self,
@@ -489,34 +599,60 @@ class AutocosmosScraper:
         if brands:
             all_brands = [b for b in all_brands if b["slug"] in brands]
 
+        yield from self.scrape_brands(all_brands, save_progress=save_progress)
+
+    def scrape_brands(
+        self,
+        brands: list[dict],
+        save_progress: bool = True
+    ) -> Generator[NewCarModel, None, None]:
+        """
+        Scrape all models of the given brands, in catalog order
+
+        Args:
+            brands: Brand dicts as returned by get_all_brands
+            save_progress: Whether to save progress to file
+
+        Yields:
+            NewCarModel objects
+        """
         total_models = 0
         progress_file = self.config.raw_data_path / "autocosmos" / "scrape_progress.json"
         progress_file.parent.mkdir(parents=True, exist_ok=True)
 
-        for brand in all_brands:
-            logger.info(f"Processing brand: {brand['name']}")
-
-            models = self.get_brand_models(brand["slug"])
-
-            for model_info in models:
-                model = self.get_model_details(brand["slug"], model_info["slug"])
+        # Page fetches are network-bound, so fan them out over the connection
+        # pool; ex.map keeps results (and progress) in catalog order
+        ex = ThreadPoolExecutor(max_workers=self.POOL_SIZE)
+        try:
+            pairs = []
+            brand_models = ex.map(lambda b: self.get_brand_models(b["slug"]), brands)
+            for brand, models in zip(brands, brand_models):
+                logger.info(f"Processing brand: {brand['name']}")
+                pairs.extend((brand, model_info["slug"]) for model_info in models)
+
+            details = ex.map(lambda p: self.get_model_details(p[0]["slug"], p[1]), pairs)
+            for (brand, _), model in zip(pairs, details):
                 if model:
                     total_models += 1
                     yield model
 
-                    if save_progress and total_models % 10 == 0:
+                    if save_progress and total_models % self.PROGRESS_EVERY == 0:
                         self._save_progress(progress_file, {
                             "total_models": total_models,
                             "current_brand": brand["name"],
                             "timestamp": str(date.today()),
                         })
+        finally:
+            # Drop queued fetches if the caller stops iterating early
+            ex.shutdown(cancel_futures=True)
 
         logger.info(f"Completed scraping {total_models} models")
 
     def _save_progress(self, path: Path, data: dict):
-        """Save scraping progress"""
-        with open(path, "w") as f:
-            json.dump(data, f)
+        """Save scraping progress (atomically, so a crash never leaves a torn file)"""
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        tmp_path.replace(path)
 
     def save_catalog(self, output_path: Optional[Path] = None):
         """
@@ -533,36 +669,12 @@ class AutocosmosScraper:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        catalog = []
-        for model in self.scrape_all_models():
-            model_dict = {
-                "brand": model.brand,
-                "model": model.model,
-                "year": model.year,
-                "body_type": model.body_type.value if model.body_type else None,
-                "base_price_mxn": str(model.base_price_mxn) if model.base_price_mxn else None,
-                "engine": model.engine,
-                "transmission": model.transmission.value if model.transmission else None,
-                "fuel_type": model.fuel_type.value if model.fuel_type else None,
-                "origin_country": model.origin_country,
-                "scraped_date": model.scraped_date.isoformat() if model.scraped_date else None,
-                "versions": [
-                    {
-                        "name": v.name,
-                        "price_mxn": str(v.price_mxn),
-                        "engine": v.engine,
-                        "horsepower": v.horsepower,
-                        "transmission": v.transmission.value if v.transmission else None,
-                    }
-                    for v in model.versions
-                ],
-            }
-            catalog.append(model_dict)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(catalog, f, ensure_ascii=False, indent=2)
+        # Stream models to disk as they are scraped (via a temp file, so an
+        # interrupted scrape never leaves a truncated catalog behind); Decimal
+        # prices are written as strings
+        count = write_json_array(output_path, self.scrape_all_models(), default=str)
 
-        logger.info(f"Saved catalog with {len(catalog)} models to {output_path}")
+        logger.info(f"Saved catalog with {count} models to {output_path}")
         return output_path
 
 
@@ -11,18 +11,26 @@ Sources:
   - URL: https://www.inegi.org.mx/programas/vehiculosmotor/
 """
 import csv
+import html
 import io
-import json
 import logging
 import re
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 from typing import Generator, Optional
 from urllib.parse import urljoin
 
+import orjson
+import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from ..config import get_config
 from ..models import INEGIProductionData, INEGIRegistrationData
@@ -55,9 +63,54 @@ class INEGICollector:
         "exportacion_vehiculos_ligeros": "6207067856",
     }
 
+    # How long cached pages stay fresh (only used if requests-cache is installed)
+    HTTP_CACHE_EXPIRE = timedelta(hours=6)
+
+    # Connection pool size; also the max worker threads used for fan-out
+    POOL_SIZE = 8
+
+    # Quoted href of the first <a> linking to a .csv file, matched on raw bytes
+    _CSV_HREF_RE = re.compile(
+        rb"""<a\s(?:[^>]*?\s)?href\s*=\s*(["'])([^"'>]*?\.csv[^"']*)\1""", re.IGNORECASE
+    )
+
+    # Bytes written per chunk when streaming bulletin PDFs to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    # Column headers that may hold each RAIAVL field, in lookup order
+    RAIAVL_COLUMNS = {
+        "brand": ("Marca", "marca", "Brand"),
+        "model": ("Modelo", "modelo", "Model"),
+        "production": ("Produccion", "produccion"),
+        "sales": ("Ventas", "ventas"),
+        "exports": ("Exportacion", "exportacion"),
+        "period": ("Periodo", "periodo"),
+    }
+
+    # Column headers that may hold each VMRC field, in lookup order, and the
+    # value a field takes when a file has none of them
+    VMRC_COLUMNS = {
+        "year": ("Anio", "Year"),
+        "state": ("Entidad", "State"),
+        "state_code": ("Clave", "Code"),
+        "vehicle_class": ("Clase", "Class"),
+        "service_type": ("Tipo_Servicio", "Service"),
+        "total": ("Total",),
+    }
+    VMRC_DEFAULTS = {
+        "year": "",
+        "state": "",
+        "state_code": "",
+        "vehicle_class": "automovil",
+        "service_type": "particular",
+        "total": 0,
+    }
+
     def __init__(self):
         self.config = get_config()
-        self.session = requests.Session()
+        self.session = self._make_session()
+        # (hour, periods) of the last get_available_periods() result
+        self._periods_memo = None
         # Use browser-like headers for INEGI (they block non-browser requests)
         self.session.headers.update({
             "User-Agent": (
@@ -72,6 +125,38 @@ class INEGICollector:
             "Accept-Language": "es-MX,es;q=0.9,en;q=0.8",
             "Connection": "keep-alive",
         })
+        # Ask for every content coding urllib3 can decode here: gzip/deflate
+        # always, plus br/zstd when brotli/zstandard are installed
+        self.session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        # Every request goes to inegi.org.mx, so keep pooled connections alive
+        # across calls and retry transient server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _make_session(self) -> requests.Session:
+        """Create the HTTP session, cached on disk when requests-cache is installed"""
+        try:
+            import requests_cache
+        except ImportError:
+            return requests.Session()
+
+        cache_path = self.config.raw_data_path / "inegi" / "http_cache.sqlite"
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        return requests_cache.CachedSession(
+            str(cache_path),
+            expire_after=self.HTTP_CACHE_EXPIRE,
+            # Published bulletins never change, so keep them indefinitely
+            urls_expire_after={"*/saladeprensa/boletines/*": requests_cache.NEVER_EXPIRE},
+            cache_control=True,
+            stale_if_error=True,
+        )
 
     def fetch_raiavl_data(
         self,
@@ -137,19 +222,29 @@ class INEGICollector:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Look for CSV export link or form
-            csv_link = soup.find("a", href=re.compile(r"\.csv", re.I))
-            if csv_link:
-                csv_url = urljoin(url, csv_link["href"])
+            # Look for CSV export link or form: a scan of the raw bytes finds
+            # the usual quoted href without building a DOM; anything it misses
+            # (unquoted attributes, odd markup) goes through the parser
+            match = self._CSV_HREF_RE.search(response.content)
+            if match:
+                csv_hrefs = [html.unescape(match.group(2).decode("utf-8", "replace"))]
+            else:
+                tree = lxml_html.fromstring(response.content)
+                csv_hrefs = tree.xpath(
+                    "//a[contains(translate(@href, 'CSV', 'csv'), '.csv')]/@href"
+                )
+            if csv_hrefs:
+                csv_url = urljoin(url, csv_hrefs[0])
                 csv_response = self.session.get(csv_url, timeout=30)
                 csv_response.raise_for_status()
 
-                # Parse CSV
-                reader = csv.DictReader(io.StringIO(csv_response.text))
+                # Parse CSV, resolving the header to column positions once
+                reader = csv.reader(io.StringIO(csv_response.text))
+                columns = self._raiavl_columns(next(reader, []))
                 for row in reader:
-                    data = self._parse_raiavl_row(row, year, month)
+                    if not row:
+                        continue
+                    data = self._parse_raiavl_row(row, columns, year, month)
                     if data:
                         results.append(data)
 
@@ -172,38 +267,58 @@ class INEGICollector:
             logger.warning("INEGI API token not configured")
             return results
 
-        for indicator_name, indicator_id in self.INDICATORS.items():
-            try:
-                # Build API URL
-                # Format: /INDICATOR/{id}/{lang}/{area}/{recent}/{source}/{version}/{token}
-                api_url = (
-                    f"{self.API_BASE}/INDICATOR/{indicator_id}/es/00/false/BISE/2.0/{token}"
-                    "?type=json"
-                )
+        # One request per indicator; they are independent, so overlap them
+        with ThreadPoolExecutor(max_workers=min(len(self.INDICATORS), self.POOL_SIZE)) as ex:
+            for records in ex.map(
+                lambda item: self._fetch_one_indicator(*item, token, year, month),
+                self.INDICATORS.items(),
+            ):
+                results.extend(records)
 
-                response = self.session.get(api_url, timeout=30)
-                response.raise_for_status()
+        return results
 
-                data = response.json()
-                series = data.get("Series", [])
+    def _fetch_one_indicator(
+        self,
+        indicator_name: str,
+        indicator_id: str,
+        token: str,
+        year: int,
+        month: Optional[int]
+    ) -> list[INEGIProductionData]:
+        """Fetch one INEGI API indicator, filtered to year/month"""
+        results = []
 
-                for serie in series:
-                    observations = serie.get("OBSERVATIONS", [])
-                    for obs in observations:
-                        period = obs.get("TIME_PERIOD", "")
-                        value = obs.get("OBS_VALUE", 0)
+        try:
+            # Build API URL
+            # Format: /INDICATOR/{id}/{lang}/{area}/{recent}/{source}/{version}/{token}
+            api_url = (
+                f"{self.API_BASE}/INDICATOR/{indicator_id}/es/00/false/BISE/2.0/{token}"
+                "?type=json"
+            )
 
-                        # Filter by year/month
-                        if period.startswith(str(year)):
-                            if month is None or period.endswith(f"-{month:02d}"):
-                                results.append(INEGIProductionData(
-                                    period=period,
-                                    brand="Total",
-                                    **{indicator_name.replace("_vehiculos_ligeros", "_units"): int(value)}
-                                ))
+            response = self.session.get(api_url, timeout=30)
+            response.raise_for_status()
 
-            except Exception as e:
-                logger.error(f"Error fetching indicator {indicator_name}: {e}")
+            data = response.json()
+            series = data.get("Series", [])
+
+            for serie in series:
+                observations = serie.get("OBSERVATIONS", [])
+                for obs in observations:
+                    period = obs.get("TIME_PERIOD", "")
+                    value = obs.get("OBS_VALUE", 0)
+
+                    # Filter by year/month
+                    if period.startswith(str(year)):
+                        if month is None or period.endswith(f"-{month:02d}"):
+                            results.append(INEGIProductionData(
+                                period=period,
+                                brand="Total",
+                                **{indicator_name.replace("_vehiculos_ligeros", "_units"): int(value)}
+                            ))
+
+        except Exception as e:
+            logger.error(f"Error fetching indicator {indicator_name}: {e}")
 
         return results
 
@@ -219,20 +334,17 @@ class INEGICollector:
             response = self.session.get(self.RAIAVL_TABULADOS, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = lxml_html.fromstring(response.content)
 
             # Find data tables
-            tables = soup.find_all("table")
-            for table in tables:
-                rows = table.find_all("tr")
+            for table in tree.iter("table"):
                 headers = []
-                for row in rows:
-                    cells = row.find_all(["th", "td"])
+                for row in table.iter("tr"):
+                    values = [self._cell_text(c) for c in row.iter("th", "td")]
                     if not headers:
-                        headers = [c.get_text(strip=True) for c in cells]
+                        headers = values
                         continue
 
-                    values = [c.get_text(strip=True) for c in cells]
                     if len(values) >= 2:
                         # Parse row based on table structure
                         data = self._parse_table_row(headers, values, year, month)
@@ -244,25 +356,40 @@ class INEGICollector:
 
         return results
 
+    @staticmethod
+    def _cell_text(cell) -> str:
+        """Text of an lxml table cell, stripped like BeautifulSoup's get_text(strip=True)"""
+        return "".join(text.strip() for text in cell.itertext())
+
+    def _raiavl_columns(self, headers: list) -> dict:
+        """Map each RAIAVL field to the index of its column (None if absent)"""
+        index = {name: i for i, name in enumerate(headers)}
+        return {
+            field: next((index[name] for name in names if name in index), None)
+            for field, names in self.RAIAVL_COLUMNS.items()
+        }
+
     def _parse_raiavl_row(
         self,
-        row: dict,
+        row: list,
+        columns: dict,
         year: int,
         month: Optional[int]
     ) -> Optional[INEGIProductionData]:
         """Parse a CSV row into INEGIProductionData"""
         try:
             # CSV columns may vary, adapt based on actual format
-            brand = row.get("Marca", row.get("marca", row.get("Brand", "")))
-            model = row.get("Modelo", row.get("modelo", row.get("Model", "")))
+            brand = self._column(row, columns["brand"], "")
+            model = self._column(row, columns["model"], "")
 
-            production = self._parse_int(row.get("Produccion", row.get("produccion", 0)))
-            sales = self._parse_int(row.get("Ventas", row.get("ventas", 0)))
-            exports = self._parse_int(row.get("Exportacion", row.get("exportacion", 0)))
+            production = self._parse_int(self._column(row, columns["production"], 0))
+            sales = self._parse_int(self._column(row, columns["sales"], 0))
+            exports = self._parse_int(self._column(row, columns["exports"], 0))
 
-            period_str = row.get("Periodo", row.get("periodo", f"{year}"))
             if month:
                 period_str = f"{year}-{month:02d}"
+            else:
+                period_str = self._column(row, columns["period"], f"{year}")
 
             return INEGIProductionData(
                 period=period_str,
@@ -276,6 +403,13 @@ class INEGICollector:
             logger.warning(f"Error parsing row: {e}")
             return None
 
+    @staticmethod
+    def _column(row: list, index: Optional[int], default):
+        """Value of a row's column; default if the column is absent, None if the row is short"""
+        if index is None:
+            return default
+        return row[index] if index < len(row) else None
+
     def _parse_table_row(
         self,
         headers: list,
@@ -285,8 +419,8 @@ class INEGICollector:
     ) -> Optional[INEGIProductionData]:
         """Parse an HTML table row"""
         try:
-            row_dict = dict(zip(headers, values))
-            return self._parse_raiavl_row(row_dict, year, month)
+            columns = self._raiavl_columns(headers[:len(values)])
+            return self._parse_raiavl_row(values, columns, year, month)
         except Exception:
             return None
 
@@ -295,8 +429,9 @@ class INEGICollector:
         if isinstance(value, int):
             return value
         if isinstance(value, str):
-            # Remove commas, spaces, and other formatting
-            cleaned = re.sub(r"[,\s]", "", value)
+            # Remove commas, spaces, and other formatting (str.split() splits
+            # on the same whitespace as \s, without the regex engine)
+            cleaned = "".join(value.split()).replace(",", "")
             try:
                 return int(cleaned)
             except ValueError:
@@ -331,16 +466,27 @@ class INEGICollector:
             response = self.session.get(vmrc_url, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
             # Look for data links or embedded data
             # This will need adaptation based on actual page structure
             data_links = soup.find_all("a", href=re.compile(r"\.csv|\.xlsx", re.I))
 
-            for link in data_links:
-                file_url = urljoin(vmrc_url, link["href"])
-                if ".csv" in file_url.lower():
-                    results.extend(self._fetch_vmrc_csv(file_url, year, month, state))
+            csv_urls = [
+                file_url
+                for file_url in (urljoin(vmrc_url, link["href"]) for link in data_links)
+                if ".csv" in file_url.lower()
+            ]
+
+            # Downloads are independent and network-bound, so overlap them;
+            # ex.map keeps results in link order
+            if csv_urls:
+                with ThreadPoolExecutor(max_workers=min(len(csv_urls), self.POOL_SIZE)) as ex:
+                    for records in ex.map(
+                        lambda file_url: self._fetch_vmrc_csv(file_url, year, month, state),
+                        csv_urls,
+                    ):
+                        results.extend(records)
 
         except Exception as e:
             logger.error(f"Error fetching VMRC data: {e}")
@@ -361,25 +507,41 @@ class INEGICollector:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            reader = csv.DictReader(io.StringIO(response.text))
-            for row in reader:
-                # Filter by year/month/state as needed
-                row_year = row.get("Anio", row.get("Year", ""))
-                if str(year) not in str(row_year):
-                    continue
-
-                row_state = row.get("Entidad", row.get("State", ""))
-                if state and state.lower() not in row_state.lower():
-                    continue
-
-                results.append(INEGIRegistrationData(
-                    period=f"{year}-{month:02d}" if month else str(year),
+            # Parse with pandas' C reader, keeping every cell as text and only
+            # the known columns (so ragged rows are padded or trimmed)
+            wanted = {name for names in self.VMRC_COLUMNS.values() for name in names}
+            df = pd.read_csv(
+                io.StringIO(response.text),
+                dtype=str,
+                keep_default_na=False,
+                usecols=lambda column: column in wanted,
+            )
+            table = pd.DataFrame(index=df.index)
+            for field, names in self.VMRC_COLUMNS.items():
+                name = next((name for name in names if name in df.columns), None)
+                table[field] = df[name] if name is not None else self.VMRC_DEFAULTS[field]
+
+            # Filter by year/state as needed
+            table = table[table["year"].str.contains(str(year), regex=False)]
+            if state:
+                table = table[table["state"].str.lower().str.contains(state.lower(), regex=False)]
+
+            # Every record of the file shares one period string
+            period_str = f"{year}-{month:02d}" if month else str(year)
+            results = [
+                INEGIRegistrationData(
+                    period=period_str,
                     state=row_state,
-                    state_code=row.get("Clave", row.get("Code", "")),
-                    vehicle_class=row.get("Clase", row.get("Class", "automovil")),
-                    service_type=row.get("Tipo_Servicio", row.get("Service", "particular")),
-                    total_registered=self._parse_int(row.get("Total", 0)),
-                ))
+                    state_code=state_code,
+                    vehicle_class=vehicle_class,
+                    service_type=service_type,
+                    total_registered=self._parse_int(total),
+                )
+                for row_state, state_code, vehicle_class, service_type, total in zip(
+                    table["state"], table["state_code"], table["vehicle_class"],
+                    table["service_type"], table["total"],
+                )
+            ]
 
         except Exception as e:
             logger.error(f"Error fetching VMRC CSV: {e}")
@@ -416,11 +578,15 @@ class INEGICollector:
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            response = self.session.get(bulletin_url, timeout=60)
-            response.raise_for_status()
-
-            with open(save_path, "wb") as f:
-                f.write(response.content)
+            # Stream the PDF to disk in chunks instead of buffering it whole,
+            # and only move it into place once it is complete
+            tmp_path = save_path.with_suffix(".tmp")
+            with self.session.get(bulletin_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            tmp_path.replace(save_path)
 
             logger.info(f"Downloaded bulletin to {save_path}")
             return save_path
@@ -429,29 +595,89 @@ class INEGICollector:
             logger.error(f"Error downloading bulletin: {e}")
             return None
 
+    def download_bulletins_bulk(
+        self,
+        periods: list[tuple[int, int]]
+    ) -> list[Optional[Path]]:
+        """
+        Download several monthly RAIAVL bulletin PDFs concurrently
+
+        Args:
+            periods: (year, month) pairs to download
+
+        Returns:
+            Path to each downloaded file (None if it failed), in input order
+        """
+        if not periods:
+            return []
+
+        # Each download is an independent, network-bound fetch over the shared
+        # connection pool; ex.map keeps results in input order
+        with ThreadPoolExecutor(max_workers=min(len(periods), self.POOL_SIZE)) as ex:
+            return list(ex.map(lambda period: self.download_monthly_bulletin(*period), periods))
+
     def get_available_periods(self) -> list[str]:
         """Get list of available data periods from INEGI"""
+        # The list changes at most monthly, so reuse it within the same hour
+        hour = int(time.time() // 3600)
+        if self._periods_memo and self._periods_memo[0] == hour:
+            return list(self._periods_memo[1])
+
         periods = []
 
+        # Revalidate the last parsed result with the validators the page was
+        # served with, so an unchanged page is answered with a bodiless 304
+        cache_path = self.config.raw_data_path / "inegi" / "periods_cache.json"
+        cached = self._load_periods_cache(cache_path)
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = self.session.get(self.RAIAVL_BASE, timeout=30)
-            response.raise_for_status()
+            response = self.session.get(self.RAIAVL_BASE, headers=headers, timeout=30)
+            if response.status_code == 304 and "periods" in cached:
+                periods = cached["periods"]
+            else:
+                response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+                # Look for period selectors or date references
+                # Extract years and months mentioned
+                year_pattern = re.compile(r"20\d{2}")
+                years = set(year_pattern.findall(response.text))
 
-            # Look for period selectors or date references
-            # Extract years and months mentioned
-            year_pattern = re.compile(r"20\d{2}")
-            years = set(year_pattern.findall(response.text))
+                for year in sorted(years, reverse=True):
+                    for month in range(1, 13):
+                        periods.append(f"{year}-{month:02d}")
+                periods = periods[:24]  # Return last 24 months
 
-            for year in sorted(years, reverse=True):
-                for month in range(1, 13):
-                    periods.append(f"{year}-{month:02d}")
+                self._save_periods_cache(cache_path, {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "periods": periods,
+                })
+
+            self._periods_memo = (hour, periods)
 
         except Exception as e:
             logger.error(f"Error getting available periods: {e}")
 
-        return periods[:24]  # Return last 24 months
+        return list(periods)
+
+    def _load_periods_cache(self, path: Path) -> dict:
+        """Load the cached periods and their validators ({} if missing or unreadable)"""
+        try:
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_periods_cache(self, path: Path, data: dict):
+        """Save the periods cache (atomically, so a crash never leaves a torn file)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        tmp_path.replace(path)
 
 
 def main():
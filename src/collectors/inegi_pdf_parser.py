@@ -10,6 +10,37 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# "octubre de 2025" / "octubre 2025" mentions in the (lowercased) bulletin text
+_MONTH_YEAR_RE = re.compile(
+    r"(enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)\s+(?:de\s+)?(\d{4})"
+)
+# raiavl_YYYY_MM in the PDF file name
+_FILENAME_PERIOD_RE = re.compile(r"(\d{4})_(\d{2})")
+# Space-grouped integers in the summary table ("1 230 000")
+_TABLE_NUM_RE = re.compile(r'[\d][\d\s]*[\d]')
+# Signed, possibly grouped or decimal numbers on a brand table line
+_BRAND_NUM_RE = re.compile(r'-?\d[\d\s,]*\.?\d*')
+# Headline mentions of each summary figure; its YoY variation is the first
+# percentage that follows the first mention
+_VARIATION_KEYWORD_RE = re.compile(
+    r"(?P<sales>ventas)|(?P<production>producción)|(?P<exports>exportación)", re.IGNORECASE
+)
+_PERCENT_RE = re.compile(r"([+-]?\d+\.?\d*)\s*%")
+
+# Brand names as they start rows of the bulletin's brand table
+_BRANDS = [
+    'Acura', 'Audi', 'Bentley', 'BMW', 'Chirey', 'Ford', 'General Motors',
+    'Honda', 'Hyundai', 'Infiniti', 'Isuzu', 'Jaguar', 'KIA', 'Land Rover',
+    'Lexus', 'Lincoln', 'Mazda', 'Mercedes', 'MG Motor', 'Mitsubishi',
+    'Nissan', 'Peugeot', 'Porsche', 'Renault', 'SEAT', 'Stellantis',
+    'Subaru', 'Suzuki', 'Toyota', 'Volkswagen', 'Volvo'
+]
+# A line starting with any brand, longest name first so no brand can be
+# shadowed by a shorter one that happens to be its prefix
+_BRAND_LINE_RE = re.compile(
+    "|".join(re.escape(brand) for brand in sorted(_BRANDS, key=len, reverse=True))
+)
+
 
 @dataclass
 class RAIAVLMonthlyData:
@@ -66,11 +97,12 @@ def parse_raiavl_bulletin(pdf_path: Path) -> Optional[RAIAVLMonthlyData]:
         return None
 
     try:
-        doc = fitz.open(pdf_path)
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text() + "\n"
-        doc.close()
+        # Join the page texts once rather than growing one string page by page.
+        # Plain "text" extraction is kept on purpose: the row scans below are
+        # tuned to its reading order (a label line followed by its figures),
+        # which "blocks"/"dict" output regroups by position
+        with fitz.open(pdf_path) as doc:
+            full_text = "".join(f"{page.get_text()}\n" for page in doc)
 
         return _parse_bulletin_text(full_text, pdf_path)
 
@@ -92,10 +124,7 @@ def _parse_bulletin_text(text: str, pdf_path: Path) -> Optional[RAIAVLMonthlyDat
 
     # Find the data month from the text
     # Look for the month mentioned in the summary section (second occurrence is usually data month)
-    all_months = re.findall(
-        r"(enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)\s+(?:de\s+)?(\d{4})",
-        text.lower()
-    )
+    all_months = _MONTH_YEAR_RE.findall(text.lower())
     # The data month is usually the second unique month mentioned (first is publication date)
     data_month_match = None
     if len(all_months) >= 2:
@@ -108,7 +137,7 @@ def _parse_bulletin_text(text: str, pdf_path: Path) -> Optional[RAIAVLMonthlyDat
     else:
         # Fall back to filename
         filename = pdf_path.stem
-        match = re.search(r"(\d{4})_(\d{2})", filename)
+        match = _FILENAME_PERIOD_RE.search(filename)
         if match:
             year = int(match.group(1))
             # Bulletin month - 1 = data month
@@ -126,72 +155,60 @@ def _parse_bulletin_text(text: str, pdf_path: Path) -> Optional[RAIAVLMonthlyDat
                       'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre']
     current_month_name = month_names_es[month - 1]
 
-    monthly_sales = 0
-    monthly_production = 0
-    monthly_exports = 0
-    ytd_sales = 0
-    ytd_production = 0
-    ytd_exports = 0
+    # A row label opens a window over the next 14 lines, whose figures above
+    # the row's minimum are collected until a stop marker. Open windows are
+    # fed as the scan passes each line, so every line is tokenized once; the
+    # earliest window that yields six figures wins (the current period's
+    # sales, production and exports are the 4th to 6th)
+    row_rules = {
+        "monthly": (1000, ("Enero-",)),         # Filter small numbers
+        "ytd": (10000, ("1/", "Fuente")),       # YTD numbers are bigger
+    }
+    ytd_pattern = f"enero-{current_month_name.lower()}"
+    totals = {}
+    open_windows = []  # [row, last line index, numbers], oldest first
 
-    # Parse by scanning for month name and collecting numbers from following lines
     lines = text.split('\n')
-    found_monthly = False
-    found_ytd = False
-
+    last_start = len(lines) - 10
     for i, line in enumerate(lines):
-        line_clean = line.strip()
-
-        # Look for monthly data row (just the month name, e.g., "Octubre")
-        # Only use the first occurrence with valid numbers
-        if not found_monthly and line_clean == current_month_name and i < len(lines) - 10:
-            numbers = []
-            for j in range(i+1, min(i+15, len(lines))):
-                nums = re.findall(r'[\d][\d\s]*[\d]', lines[j])
-                for n in nums:
-                    val = int(n.replace(' ', ''))
-                    if val > 1000:  # Filter small numbers
-                        numbers.append(val)
-                # Stop when we hit the next section
-                if 'Enero-' in lines[j]:
-                    break
-
-            if len(numbers) >= 6:
-                # Format: prev_sales, prev_prod, prev_exp, curr_sales, curr_prod, curr_exp
-                monthly_sales = numbers[3]
-                monthly_production = numbers[4]
-                monthly_exports = numbers[5]
-                found_monthly = True
-                logger.debug(f"Monthly data: {monthly_sales}, {monthly_production}, {monthly_exports}")
-
-        # Look for YTD row (Enero-MONTH) - immediately after monthly data
-        ytd_pattern = f"enero-{current_month_name.lower()}"  # all lowercase for comparison
-        if not found_ytd and ytd_pattern in line_clean.lower() and i < len(lines) - 10:
-            numbers = []
-            for j in range(i+1, min(i+15, len(lines))):
-                nums = re.findall(r'[\d][\d\s]*[\d]', lines[j])
-                for n in nums:
-                    val = int(n.replace(' ', ''))
-                    if val > 10000:  # YTD numbers are bigger
-                        numbers.append(val)
-                # Stop at footnote or next section
-                if '1/' in lines[j] or 'Fuente' in lines[j]:
-                    break
-
-            if len(numbers) >= 6:
-                ytd_sales = numbers[3]
-                ytd_production = numbers[4]
-                ytd_exports = numbers[5]
-                found_ytd = True
-                logger.debug(f"YTD data: {ytd_sales}, {ytd_production}, {ytd_exports}")
+        if open_windows:
+            values = [int(n.replace(' ', '')) for n in _TABLE_NUM_RE.findall(line)]
+            still_open = []
+            for window in open_windows:
+                row, last, numbers = window
+                if row in totals:
+                    continue
+                min_value, stop_markers = row_rules[row]
+                numbers.extend(v for v in values if v > min_value)
+                if i < last and not any(marker in line for marker in stop_markers):
+                    still_open.append(window)
+                elif len(numbers) >= 6:
+                    totals[row] = numbers[3:6]
+                    logger.debug(f"{row} data: {totals[row]}")
+            open_windows = still_open
 
         # Once we have both, stop searching
-        if found_monthly and found_ytd:
+        if len(totals) == 2:
             break
 
+        if i < last_start:
+            line_clean = line.strip()
+            last = min(i + 14, len(lines) - 1)
+            # Monthly data row is just the month name, e.g. "Octubre"
+            if "monthly" not in totals and line_clean == current_month_name:
+                open_windows.append(["monthly", last, []])
+            # YTD row (Enero-MONTH) follows the monthly data
+            if "ytd" not in totals and ytd_pattern in line_clean.lower():
+                open_windows.append(["ytd", last, []])
+
+    monthly_sales, monthly_production, monthly_exports = totals.get("monthly", (0, 0, 0))
+    ytd_sales, ytd_production, ytd_exports = totals.get("ytd", (0, 0, 0))
+
     # Extract YoY variations from summary section
-    sales_yoy = _extract_variation(text, 'ventas', 'variación')
-    production_yoy = _extract_variation(text, 'producción', 'variación')
-    exports_yoy = _extract_variation(text, 'exportación', 'variación')
+    variations = _extract_variations(text)
+    sales_yoy = variations.get('sales', 0.0)
+    production_yoy = variations.get('production', 0.0)
+    exports_yoy = variations.get('exports', 0.0)
 
     # Parse brand breakdown table
     brand_sales = _parse_brand_table(text, year, month)
@@ -215,67 +232,69 @@ def _parse_bulletin_text(text: str, pdf_path: Path) -> Optional[RAIAVLMonthlyDat
 
 def _parse_number(s: str) -> int:
     """Parse a number string, removing spaces and commas"""
-    cleaned = re.sub(r'[\s,]', '', s)
+    # Drop thousands separators and any spacing (str.split() splits on the
+    # same whitespace as \s, without the regex engine)
+    cleaned = ''.join(s.split()).replace(',', '')
     try:
         return int(cleaned)
     except ValueError:
         return 0
 
 
-def _extract_variation(text: str, keyword: str, prefix: str) -> float:
-    """Extract percentage variation from text"""
-    pattern = rf"{keyword}.*?([+-]?\d+\.?\d*)\s*%"
-    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-    if match:
-        try:
-            return float(match.group(1))
-        except ValueError:
-            pass
-    return 0.0
+def _extract_variations(text: str) -> dict:
+    """Extract the percentage variation after the first mention of each figure"""
+    # One scan finds the first mention of every keyword; each percentage
+    # search then resumes from its mention instead of rescanning the text
+    starts = {}
+    for match in _VARIATION_KEYWORD_RE.finditer(text):
+        starts.setdefault(match.lastgroup, match.end())
+        if len(starts) == 3:
+            break
+
+    variations = {}
+    for figure, start in starts.items():
+        match = _PERCENT_RE.search(text, start)
+        if match:
+            try:
+                variations[figure] = float(match.group(1))
+            except ValueError:
+                pass
+    return variations
 
 
 def _parse_brand_table(text: str, year: int, month: int) -> list:
     """Parse the brand-by-brand sales table"""
     brands = []
 
-    # Known brand patterns
-    brand_patterns = [
-        'Acura', 'Audi', 'Bentley', 'BMW', 'Chirey', 'Ford', 'General Motors',
-        'Honda', 'Hyundai', 'Infiniti', 'Isuzu', 'Jaguar', 'KIA', 'Land Rover',
-        'Lexus', 'Lincoln', 'Mazda', 'Mercedes', 'MG Motor', 'Mitsubishi',
-        'Nissan', 'Peugeot', 'Porsche', 'Renault', 'SEAT', 'Stellantis',
-        'Subaru', 'Suzuki', 'Toyota', 'Volkswagen', 'Volvo'
-    ]
-
     lines = text.split('\n')
     for line in lines:
         line_clean = line.strip()
 
-        for brand in brand_patterns:
-            if line_clean.startswith(brand):
-                # Extract numbers from this line
-                numbers = re.findall(r'-?\d[\d\s,]*\.?\d*', line_clean[len(brand):])
-                numbers = [_parse_number_or_float(n) for n in numbers]
-                numbers = [n for n in numbers if n is not None]
-
-                if len(numbers) >= 4:
-                    brands.append(BrandSalesData(
-                        brand=brand,
-                        monthly_previous=int(numbers[0]) if numbers[0] else 0,
-                        monthly_current=int(numbers[1]) if len(numbers) > 1 and numbers[1] else 0,
-                        monthly_variation_pct=float(numbers[2]) if len(numbers) > 2 else 0.0,
-                        ytd_previous=int(numbers[3]) if len(numbers) > 3 and numbers[3] else 0,
-                        ytd_current=int(numbers[4]) if len(numbers) > 4 and numbers[4] else 0,
-                        ytd_variation_pct=float(numbers[5]) if len(numbers) > 5 else 0.0,
-                    ))
-                break
+        match = _BRAND_LINE_RE.match(line_clean)
+        if match:
+            brand = match.group()
+            # Extract numbers from the rest of this line
+            numbers = _BRAND_NUM_RE.findall(line_clean, match.end())
+            numbers = [_parse_number_or_float(n) for n in numbers]
+            numbers = [n for n in numbers if n is not None]
+
+            if len(numbers) >= 4:
+                brands.append(BrandSalesData(
+                    brand=brand,
+                    monthly_previous=int(numbers[0]) if numbers[0] else 0,
+                    monthly_current=int(numbers[1]) if len(numbers) > 1 and numbers[1] else 0,
+                    monthly_variation_pct=float(numbers[2]) if len(numbers) > 2 else 0.0,
+                    ytd_previous=int(numbers[3]) if len(numbers) > 3 and numbers[3] else 0,
+                    ytd_current=int(numbers[4]) if len(numbers) > 4 and numbers[4] else 0,
+                    ytd_variation_pct=float(numbers[5]) if len(numbers) > 5 else 0.0,
+                ))
 
     return brands
 
 
 def _parse_number_or_float(s: str):
     """Parse a number that might be int or float"""
-    cleaned = re.sub(r'[\s,]', '', s)
+    cleaned = ''.join(s.split()).replace(',', '')
     try:
         if '.' in cleaned:
             return float(cleaned)
@@ -2,11 +2,22 @@
 Configuration loader for KAVAK Market Research
 """
 import os
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's C loader parses several times faster; PyYAML built without it
+# only has the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Marks a key that resolved to the caller's default in Config._get_cache
+_MISSING = object()
+
 
 class Config:
     """Configuration manager"""
@@ -21,13 +32,15 @@ class Config:
 
         self._config_path = Path(config_path)
         self._config = self._load_config()
+        # Resolved value (or _MISSING) per dot-notation key
+        self._get_cache: dict[str, Any] = {}
 
     def _load_config(self) -> dict:
         """Load YAML configuration file"""
-        with open(self._config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(str(self._config_path.resolve()))
 
-        # Substitute environment variables
+        # Substitute environment variables (builds new containers, so the
+        # cached parse is never modified)
         config = self._substitute_env_vars(config)
         return config
 
@@ -46,18 +59,25 @@ class Config:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value by dot-notation key"""
-        keys = key.split(".")
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._resolve(key)
+        return default if value is _MISSING else value
+
+    def _resolve(self, key: str) -> Any:
+        """Walk the config for a dot-notation key (_MISSING if absent or None)"""
         value = self._config
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
-                    return default
+                    return _MISSING
             else:
-                return default
+                return _MISSING
         return value
 
-    @property
+    @cached_property
     def cities(self) -> list:
         """Get all configured cities (tier 1 + tier 2)"""
         tier1 = self.get("geography.tier1_cities", [])
@@ -79,17 +99,17 @@ class Config:
         """Get brand tier mappings"""
         return self.get("brand_tiers", {})
 
-    @property
+    @cached_property
     def output_path(self) -> Path:
         """Get output directory path"""
         return Path(self.get("output.path", "./data/outputs/"))
 
-    @property
+    @cached_property
     def raw_data_path(self) -> Path:
         """Get raw data directory path"""
         return Path(__file__).parent.parent / "data" / "raw"
 
-    @property
+    @cached_property
     def processed_data_path(self) -> Path:
         """Get processed data directory path"""
         return Path(__file__).parent.parent / "data" / "processed"
@@ -119,13 +139,14 @@ class Config:
         return self.get("sources.kavak.api.api_key", "")
 
 
-# Global config instance
-_config = None
+@cache
+def _load_yaml(path: str) -> dict:
+    """Parse a YAML file once per process (keyed by its resolved path)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
+@cache
 def get_config() -> Config:
     """Get global config instance"""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
@@ -7,7 +7,6 @@ Usage:
     python -m src.main report --month 2025-01
 """
 import argparse
-import json
 import logging
 from datetime import date
 from pathlib import Path
@@ -15,6 +14,7 @@ from pathlib import Path
 from .collectors import AutocosmosScraper, INEGICollector
 from .config import get_config
 from .processors import get_standardizer
+from .utils import write_json_array
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,24 +41,8 @@ def collect_inegi(year: int, month: int = None, output_dir: Path = None):
     # Save to JSON
     filename = f"raiavl_{year}" + (f"_{month:02d}" if month else "") + ".json"
     output_file = output_dir / filename
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(
-            [
-                {
-                    "period": r.period,
-                    "brand": r.brand,
-                    "model": r.model,
-                    "production_units": r.production_units,
-                    "domestic_sales_units": r.domestic_sales_units,
-                    "export_units": r.export_units,
-                    "source": r.source,
-                }
-                for r in raiavl_data
-            ],
-            f,
-            ensure_ascii=False,
-            indent=2
-        )
+    # RAIAVL records are dataclasses, which orjson encodes field by field
+    write_json_array(output_file, raiavl_data)
     logger.info(f"Saved RAIAVL data to {output_file}")
 
     # Download monthly bulletin if specific month
@@ -73,24 +57,7 @@ def collect_inegi(year: int, month: int = None, output_dir: Path = None):
         logger.info(f"Fetched {len(vmrc_data)} VMRC records")
         vmrc_filename = f"vmrc_{year}" + (f"_{month:02d}" if month else "") + ".json"
         vmrc_file = output_dir / vmrc_filename
-        with open(vmrc_file, "w", encoding="utf-8") as f:
-            json.dump(
-                [
-                    {
-                        "period": r.period,
-                        "state": r.state,
-                        "state_code": r.state_code,
-                        "vehicle_class": r.vehicle_class,
-                        "service_type": r.service_type,
-                        "total_registered": r.total_registered,
-                        "source": r.source,
-                    }
-                    for r in vmrc_data
-                ],
-                f,
-                ensure_ascii=False,
-                indent=2
-            )
+        write_json_array(vmrc_file, vmrc_data)
         logger.info(f"Saved VMRC data to {vmrc_file}")
 
     return len(raiavl_data) + len(vmrc_data)
@@ -113,62 +80,52 @@ def collect_autocosmos(brands: list = None, output_dir: Path = None):
 
     # Save brand list
     brands_file = output_dir / "brands.json"
-    with open(brands_file, "w", encoding="utf-8") as f:
-        json.dump(all_brands, f, ensure_ascii=False, indent=2)
+    write_json_array(brands_file, all_brands)
 
     # Filter brands if specified
     if brands:
         all_brands = [b for b in all_brands if b["slug"] in brands]
         logger.info(f"Filtering to {len(all_brands)} specified brands")
 
-    # Collect model data
-    catalog = []
+    # Collect model data, writing each standardized model to the catalog as
+    # soon as it is scraped
     standardizer = get_standardizer()
-
-    for brand in all_brands:
-        logger.info(f"Processing {brand['name']}...")
-
-        models = scraper.get_brand_models(brand["slug"])
-        logger.info(f"  Found {len(models)} models")
-
-        for model_info in models:
-            model = scraper.get_model_details(brand["slug"], model_info["slug"])
-            if model:
-                # Standardize
-                model_dict = {
-                    "brand": model.brand,
-                    "model": model.model,
-                    "year": model.year,
-                    "body_type": model.body_type.value if model.body_type else None,
-                    "base_price_mxn": str(model.base_price_mxn) if model.base_price_mxn else None,
-                    "engine": model.engine,
-                    "transmission": model.transmission.value if model.transmission else None,
-                    "fuel_type": model.fuel_type.value if model.fuel_type else None,
-                    "origin_country": model.origin_country,
-                    "scraped_date": model.scraped_date.isoformat() if model.scraped_date else None,
-                    "versions": [
-                        {
-                            "name": v.name,
-                            "price_mxn": str(v.price_mxn),
-                            "engine": v.engine,
-                            "horsepower": v.horsepower,
-                            "transmission": v.transmission.value if v.transmission else None,
-                        }
-                        for v in model.versions
-                    ],
-                }
-
-                # Add standardized fields
-                model_dict = standardizer.standardize_record(model_dict)
-                catalog.append(model_dict)
-
-    # Save catalog
     catalog_file = output_dir / f"catalog_{date.today().isoformat()}.json"
-    with open(catalog_file, "w", encoding="utf-8") as f:
-        json.dump(catalog, f, ensure_ascii=False, indent=2)
 
-    logger.info(f"Saved {len(catalog)} models to {catalog_file}")
-    return len(catalog)
+    def standardized_models(models):
+        for model in models:
+            # Standardize
+            model_dict = {
+                "brand": model.brand,
+                "model": model.model,
+                "year": model.year,
+                "body_type": model.body_type.value if model.body_type else None,
+                "base_price_mxn": str(model.base_price_mxn) if model.base_price_mxn else None,
+                "engine": model.engine,
+                "transmission": model.transmission.value if model.transmission else None,
+                "fuel_type": model.fuel_type.value if model.fuel_type else None,
+                "origin_country": model.origin_country,
+                "scraped_date": model.scraped_date.isoformat() if model.scraped_date else None,
+                "versions": [
+                    {
+                        "name": v.name,
+                        "price_mxn": str(v.price_mxn),
+                        "engine": v.engine,
+                        "horsepower": v.horsepower,
+                        "transmission": v.transmission.value if v.transmission else None,
+                    }
+                    for v in model.versions
+                ],
+            }
+
+            # Add standardized fields
+            yield standardizer.standardize_record(model_dict)
+
+    models = scraper.scrape_brands(all_brands, save_progress=False)
+    count = write_json_array(catalog_file, standardized_models(models))
+
+    logger.info(f"Saved {count} models to {catalog_file}")
+    return count
 
 
 def main():
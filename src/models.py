@@ -1,10 +1,12 @@
 """
 Data models for KAVAK Market Research
 """
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -47,6 +49,13 @@ class PriceBucket(str, Enum):
     ULTRA = "ultra"          # > 1.2M
 
 
+# Exclusive upper bounds (MXN) of every PriceBucket but ULTRA, in order, so
+# PRICE_BUCKET_NAMES[bisect_right(PRICE_BUCKET_THRESHOLDS, price)] is the bucket
+PRICE_BUCKET_THRESHOLDS = (150_000, 300_000, 500_000, 800_000, 1_200_000)
+PRICE_BUCKET_NAMES = tuple(bucket.value for bucket in PriceBucket)
+_PRICE_BUCKETS = tuple(PriceBucket)
+
+
 @dataclass
 class City:
     """City configuration"""
@@ -173,38 +182,29 @@ class MarketMetrics:
 
 def get_price_bucket(price_mxn: Decimal) -> PriceBucket:
     """Determine price bucket from price"""
-    price = float(price_mxn)
-    if price < 150_000:
-        return PriceBucket.ENTRY
-    elif price < 300_000:
-        return PriceBucket.ECONOMY
-    elif price < 500_000:
-        return PriceBucket.MID_RANGE
-    elif price < 800_000:
-        return PriceBucket.PREMIUM
-    elif price < 1_200_000:
-        return PriceBucket.LUXURY
-    else:
-        return PriceBucket.ULTRA
+    return _PRICE_BUCKETS[bisect_right(PRICE_BUCKET_THRESHOLDS, float(price_mxn))]
+
 
+# Upper-cased brand names of the luxury and premium tiers (everything else is volume)
+_LUXURY_BRANDS = frozenset({
+    "PORSCHE", "LAND ROVER", "LEXUS", "JAGUAR", "MASERATI",
+    "FERRARI", "LAMBORGHINI", "BENTLEY", "ASTON MARTIN", "ROLLS-ROYCE"
+})
 
+_PREMIUM_BRANDS = frozenset({
+    "BMW", "MERCEDES-BENZ", "MERCEDES", "AUDI", "VOLVO", "MINI",
+    "ACURA", "INFINITI", "LINCOLN", "CADILLAC", "GENESIS"
+})
+
+
+@lru_cache(maxsize=4096)
 def get_brand_tier(brand: str) -> BrandTier:
     """Determine brand tier from brand name"""
     brand_upper = brand.upper()
 
-    luxury_brands = {
-        "PORSCHE", "LAND ROVER", "LEXUS", "JAGUAR", "MASERATI",
-        "FERRARI", "LAMBORGHINI", "BENTLEY", "ASTON MARTIN", "ROLLS-ROYCE"
-    }
-
-    premium_brands = {
-        "BMW", "MERCEDES-BENZ", "MERCEDES", "AUDI", "VOLVO", "MINI",
-        "ACURA", "INFINITI", "LINCOLN", "CADILLAC", "GENESIS"
-    }
-
-    if brand_upper in luxury_brands:
+    if brand_upper in _LUXURY_BRANDS:
         return BrandTier.LUXURY
-    elif brand_upper in premium_brands:
+    elif brand_upper in _PREMIUM_BRANDS:
         return BrandTier.PREMIUM
     else:
         return BrandTier.VOLUME
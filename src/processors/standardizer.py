@@ -9,15 +9,40 @@ Handles:
 """
 import re
 from decimal import Decimal
+from functools import cache, lru_cache
 from typing import Optional
 
 from ..config import get_config
 from ..models import BrandTier, PriceBucket, VehicleType, get_brand_tier, get_price_bucket
 
 
+def _keyword_matcher(keywords: list) -> tuple:
+    """
+    Compile (keyword, VehicleType) pairs into one overlapping-match regex
+
+    The lookahead alternation (longest keyword first) reports the longest
+    keyword starting at each position of a string. Any shorter keyword
+    starting there is a prefix of it, so each keyword is also mapped to the
+    types of every keyword that is its prefix; together they give every type
+    with a keyword anywhere in the string.
+    """
+    by_length = sorted((keyword for keyword, _ in keywords), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in by_length) + "))")
+    prefix_types = {
+        keyword: {vtype for other, vtype in keywords if keyword.startswith(other)}
+        for keyword, _ in keywords
+    }
+    return pattern, prefix_types
+
+
 class DataStandardizer:
     """Standardize data across different sources"""
 
+    # Characters dropped from brand names before alias lookup, and runs of
+    # whitespace collapsed to one space
+    _NON_ALNUM_RE = re.compile(r"[^a-z0-9\s-]")
+    _WHITESPACE_RE = re.compile(r"\s+")
+
     # Brand name normalization map
     BRAND_ALIASES = {
         # Common variations
@@ -178,49 +203,49 @@ class DataStandardizer:
         ],
     }
 
+    # Model names split into words on punctuation and whitespace, keeping
+    # hyphenated names ("cr-v", "f-150") whole; a word fused to a number
+    # ("ram1500") is also tried as its letters and digits
+    _MODEL_WORD_SPLIT_RE = re.compile(r"[^\w-]+")
+    _LETTERS_DIGITS_RE = re.compile(r"([^\W\d_]+)(\d+)")
+
     def __init__(self):
         self.config = get_config()
 
-    def normalize_brand(self, brand: str) -> str:
-        """Normalize brand name to standard format"""
-        if not brand:
-            return ""
-
-        # Clean and lowercase for lookup
-        cleaned = brand.strip().lower()
-        cleaned = re.sub(r"[^a-z0-9\s-]", "", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned)
+    @classmethod
+    @cache
+    def _vehicle_type_lookups(cls) -> tuple:
+        """
+        Keyword tables derived from VEHICLE_TYPE_KEYWORDS, built once per class
 
-        # Check aliases
-        if cleaned in self.BRAND_ALIASES:
-            return self.BRAND_ALIASES[cleaned]
+        Returns:
+            Single-word keyword -> type map, the multi-word keyword matcher
+            (found by substring), the every-keyword matcher (for body type
+            hints), and each type's rank in VEHICLE_TYPE_KEYWORDS so a model
+            matching several types resolves to the first one listed
+        """
+        pairs = [
+            (keyword, vtype)
+            for vtype, keywords in cls.VEHICLE_TYPE_KEYWORDS.items()
+            for keyword in keywords
+        ]
+        keyword_to_type = {keyword: vtype for keyword, vtype in pairs if " " not in keyword}
+        multiword = _keyword_matcher([(k, vtype) for k, vtype in pairs if " " in k])
+        every_keyword = _keyword_matcher(pairs)
+        rank = {vtype: rank for rank, vtype in enumerate(cls.VEHICLE_TYPE_KEYWORDS)}
+        return keyword_to_type, multiword, every_keyword, rank
 
-        # Title case as fallback
-        return brand.strip().title()
+    def normalize_brand(self, brand: str) -> str:
+        """Normalize brand name to standard format"""
+        return _normalize_brand(type(self), brand)
 
     def normalize_state(self, state: str) -> str:
         """Normalize state name"""
-        if not state:
-            return ""
-
-        cleaned = state.strip().lower()
-
-        if cleaned in self.STATE_ALIASES:
-            return self.STATE_ALIASES[cleaned]
-
-        return state.strip().title()
+        return _normalize_state(type(self), state)
 
     def get_state_for_city(self, city: str) -> Optional[str]:
         """Get state name for a city"""
-        if not city:
-            return None
-
-        cleaned = city.strip().lower()
-
-        if cleaned in self.CITY_STATE_MAP:
-            return self.CITY_STATE_MAP[cleaned]
-
-        return None
+        return _get_state_for_city(type(self), city)
 
     def classify_vehicle_type(
         self,
@@ -237,25 +262,7 @@ class DataStandardizer:
         Returns:
             VehicleType or None if unknown
         """
-        if not model_name:
-            return None
-
-        model_lower = model_name.lower()
-
-        # Check hint first
-        if body_type_hint:
-            hint_lower = body_type_hint.lower()
-            for vtype, keywords in self.VEHICLE_TYPE_KEYWORDS.items():
-                if hint_lower in keywords or any(k in hint_lower for k in keywords):
-                    return vtype
-
-        # Check model name
-        for vtype, keywords in self.VEHICLE_TYPE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in model_lower:
-                    return vtype
-
-        return None
+        return _classify_vehicle_type(type(self), model_name, body_type_hint)
 
     def assign_price_bucket(self, price_mxn: Decimal) -> PriceBucket:
         """Assign price bucket based on price"""
@@ -307,6 +314,102 @@ class DataStandardizer:
         return record
 
 
+# Pure lookups behind the DataStandardizer methods, memoized because the same
+# brands, states, cities and model names repeat across thousands of records.
+# Each takes the standardizer class and reads its maps from it, so a subclass
+# overriding a map gets its own cache entries; the maps are class constants
+# and must not be reassigned on an instance or mutated once in use
+@lru_cache(maxsize=4096)
+def _normalize_brand(cls: type, brand: str) -> str:
+    """Normalize brand name to standard format"""
+    if not brand:
+        return ""
+
+    # Clean and lowercase for lookup
+    cleaned = brand.strip().lower()
+    cleaned = cls._NON_ALNUM_RE.sub("", cleaned)
+    cleaned = cls._WHITESPACE_RE.sub(" ", cleaned)
+
+    # Check aliases
+    if cleaned in cls.BRAND_ALIASES:
+        return cls.BRAND_ALIASES[cleaned]
+
+    # Title case as fallback
+    return brand.strip().title()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_state(cls: type, state: str) -> str:
+    """Normalize state name"""
+    if not state:
+        return ""
+
+    cleaned = state.strip().lower()
+
+    if cleaned in cls.STATE_ALIASES:
+        return cls.STATE_ALIASES[cleaned]
+
+    return state.strip().title()
+
+
+@lru_cache(maxsize=4096)
+def _get_state_for_city(cls: type, city: str) -> Optional[str]:
+    """Get state name for a city"""
+    if not city:
+        return None
+
+    cleaned = city.strip().lower()
+
+    if cleaned in cls.CITY_STATE_MAP:
+        return cls.CITY_STATE_MAP[cleaned]
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_vehicle_type(
+    cls: type,
+    model_name: str,
+    body_type_hint: Optional[str] = None
+) -> Optional[VehicleType]:
+    """Classify vehicle type based on model name and hints"""
+    if not model_name:
+        return None
+
+    model_lower = model_name.lower()
+    keyword_to_type, multiword, every_keyword, rank = cls._vehicle_type_lookups()
+
+    # Check hint first: any keyword inside it, first type listed wins
+    if body_type_hint:
+        matches = _matched_types(*every_keyword, body_type_hint.lower())
+        if matches:
+            return min(matches, key=rank.__getitem__)
+
+    # Check model name word by word (so "z" no longer matches inside any
+    # model name containing a z), plus the few multi-word keywords
+    words = set()
+    for word in cls._MODEL_WORD_SPLIT_RE.split(model_lower):
+        words.add(word)
+        fused = cls._LETTERS_DIGITS_RE.fullmatch(word)
+        if fused:
+            words.update(fused.groups())
+    matches = {keyword_to_type[word] for word in words if word in keyword_to_type}
+    matches.update(_matched_types(*multiword, model_lower))
+    if matches:
+        return min(matches, key=rank.__getitem__)
+
+    return None
+
+
+def _matched_types(pattern: re.Pattern, prefix_types: dict, text: str) -> set:
+    """VehicleTypes with a keyword anywhere in text (see _keyword_matcher)"""
+    return {
+        vtype
+        for match in pattern.finditer(text)
+        for vtype in prefix_types[match.group(1)]
+    }
+
+
 # Global instance
 _standardizer = None
 
@@ -30,7 +30,8 @@ class ExcelReporter:
     def generate_new_car_report(
         self,
         output_path: Optional[Path] = None,
-        catalog_path: Optional[Path] = None
+        catalog_path: Optional[Path] = None,
+        analyzer: Optional[NewCarAnalyzer] = None
     ) -> Path:
         """
         Generate Excel report for new car data
@@ -38,6 +39,7 @@ class ExcelReporter:
         Args:
             output_path: Path for output file
             catalog_path: Path to catalog JSON
+            analyzer: Existing analyzer to reuse instead of loading catalog_path
 
         Returns:
             Path to generated file
@@ -51,7 +53,8 @@ class ExcelReporter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Load analyzer
-        analyzer = NewCarAnalyzer(catalog_path)
+        if analyzer is None:
+            analyzer = NewCarAnalyzer(catalog_path)
 
         # Create Excel writer
         with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
@@ -204,7 +207,7 @@ class ExcelReporter:
                 'Model': car.get('model', ''),
                 'Year': car.get('year', ''),
                 'Body Type': car.get('body_type', ''),
-                'Base Price (MXN)': float(car['base_price_mxn']) if car.get('base_price_mxn') else None,
+                'Base Price (MXN)': car.get('base_price_mxn') or None,
                 'Price Bucket': car.get('price_bucket', ''),
                 'Transmission': car.get('transmission', ''),
                 'Fuel Type': car.get('fuel_type', ''),
@@ -274,8 +277,9 @@ class ExcelReporter:
             for i, car in enumerate(ev_cars):
                 worksheet.write(start_row + 1 + i, 0, car.get('brand', ''))
                 worksheet.write(start_row + 1 + i, 1, car.get('model', ''))
-                if car.get('base_price_mxn'):
-                    worksheet.write(start_row + 1 + i, 2, float(car['base_price_mxn']), money_format)
+                price = car.get('base_price_mxn')
+                if price:
+                    worksheet.write(start_row + 1 + i, 2, price, money_format)
 
     def _write_geographic_sheet(self, writer, header_format, money_format, pct_format):
         """Write geographic/state analysis sheet"""
@@ -357,15 +361,23 @@ class ExcelReporter:
             worksheet.write(ev_note_row, 0, 'Note: EV sales estimated from INEGI + Statista data. Actual state data not publicly available.')
 
 
-def generate_csv_exports(catalog_path: Optional[Path] = None) -> list[Path]:
+def generate_csv_exports(
+    catalog_path: Optional[Path] = None,
+    analyzer: Optional[NewCarAnalyzer] = None
+) -> list[Path]:
     """
     Generate CSV exports from catalog data
 
+    Args:
+        catalog_path: Path to catalog JSON
+        analyzer: Existing analyzer to reuse instead of loading catalog_path
+
     Returns:
         List of generated file paths
     """
     config = get_config()
-    analyzer = NewCarAnalyzer(catalog_path)
+    if analyzer is None:
+        analyzer = NewCarAnalyzer(catalog_path)
     output_dir = config.output_path
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -378,7 +390,7 @@ def generate_csv_exports(catalog_path: Optional[Path] = None) -> list[Path]:
             'model': c.get('model', ''),
             'year': c.get('year', ''),
             'body_type': c.get('body_type', ''),
-            'base_price_mxn': float(c['base_price_mxn']) if c.get('base_price_mxn') else None,
+            'base_price_mxn': c.get('base_price_mxn') or None,
             'price_bucket': c.get('price_bucket', ''),
             'transmission': c.get('transmission', ''),
             'fuel_type': c.get('fuel_type', ''),
@@ -465,13 +477,14 @@ def main():
     logging.basicConfig(level=logging.INFO)
 
     reporter = ExcelReporter()
+    analyzer = NewCarAnalyzer()
 
     # Generate Excel report
-    excel_path = reporter.generate_new_car_report()
+    excel_path = reporter.generate_new_car_report(analyzer=analyzer)
     print(f"Generated Excel report: {excel_path}")
 
     # Generate CSV exports
-    csv_files = generate_csv_exports()
+    csv_files = generate_csv_exports(analyzer=analyzer)
     print(f"Generated {len(csv_files)} CSV files:")
     for f in csv_files:
         print(f"  - {f}")
@@ -0,0 +1,37 @@
+"""
+Shared file I/O helpers for KAVAK Market Research
+"""
+from pathlib import Path
+from typing import Iterable
+
+import orjson
+
+
+def write_json_array(path: Path, records: Iterable, default=None) -> int:
+    """
+    Stream records to a JSON array file, one compact element per line
+
+    Each record is encoded with orjson (dataclasses, enums and dates natively)
+    as soon as it is produced, so the full list is never held in memory. The
+    array goes to a temp file renamed over path once closed, so a failed run
+    never leaves a truncated file behind.
+
+    Args:
+        path: Output JSON file
+        records: Records to write, consumed lazily
+        default: orjson fallback for types it cannot encode natively
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(b"[")
+        for record in records:
+            f.write(b",\n" if count else b"\n")
+            f.write(orjson.dumps(record, default=default))
+            count += 1
+        f.write(b"\n]\n")
+    tmp_path.replace(path)
+    return count
@@ -0,0 +1,50 @@
+"""
+Tests for vehicle type classification in the data standardizer
+"""
+import pytest
+
+from src.models import VehicleType
+from src.processors import DataStandardizer
+
+
+@pytest.fixture(scope="module")
+def standardizer():
+    return DataStandardizer()
+
+
+@pytest.mark.parametrize("model_name, expected", [
+    # Keywords attached to punctuation
+    ("Tiguan, R-Line", VehicleType.SUV_MID),
+    ("(RAV4) Hybrid", VehicleType.SUV_MID),
+    ("Jetta/GLI", VehicleType.SEDAN),
+    ("Civic.", VehicleType.SEDAN),
+    ("Tracker,", VehicleType.SUV_COMPACT),
+    # Keyword fused to a number
+    ("Ram1500", VehicleType.PICKUP),
+    # Hyphenated keywords match whole
+    ("CR-V Touring", VehicleType.SUV_MID),
+    ("F-150 Lobo", VehicleType.PICKUP),
+    ("CX-5", VehicleType.SUV_MID),
+])
+def test_classify_vehicle_type_punctuated(standardizer, model_name, expected):
+    assert standardizer.classify_vehicle_type(model_name) == expected
+
+
+@pytest.mark.parametrize("model_name", ["Fitz", "Z-Line", ""])
+def test_classify_vehicle_type_no_substring_match(standardizer, model_name):
+    assert standardizer.classify_vehicle_type(model_name) is None
+
+
+def test_subclass_maps_are_used():
+    class CustomStandardizer(DataStandardizer):
+        BRAND_ALIASES = {**DataStandardizer.BRAND_ALIASES, "vw": "VW"}
+        VEHICLE_TYPE_KEYWORDS = {
+            **DataStandardizer.VEHICLE_TYPE_KEYWORDS,
+            VehicleType.PICKUP: DataStandardizer.VEHICLE_TYPE_KEYWORDS[VehicleType.PICKUP] + ["tiguan"],
+        }
+
+    base, custom = DataStandardizer(), CustomStandardizer()
+    assert base.normalize_brand("vw") == "Volkswagen"
+    assert custom.normalize_brand("vw") == "VW"
+    assert base.classify_vehicle_type("Tiguan") == VehicleType.SUV_MID
+    assert custom.classify_vehicle_type("Tiguan") == VehicleType.PICKUP